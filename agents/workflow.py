@@ -65,7 +65,9 @@ class WorkflowOrchestrator:
         self.judge_agent = judge_agent if judge_agent is not None else JudgeAgent()
         self.synthesis_agent = synthesis_agent if synthesis_agent is not None else SynthesisAgent()
         self.enable_checkpoints = enable_checkpoints
-        self.checkpoint_manager = StateCheckpoint(checkpoint_dir) if enable_checkpoints else None
+        self.checkpoint_manager = (
+            StateCheckpoint(checkpoint_dir, background_writes=True) if enable_checkpoints else None
+        )
         self.graph = self._build_graph()
         logger.info(
             f"WorkflowOrchestrator initialized with max_iterations={max_iterations}, "
@@ -423,6 +425,24 @@ class WorkflowOrchestrator:
             
             # Re-raise the original exception if recovery failed
             raise
+        
+        finally:
+            self._close_checkpoints()
+    
+    def _close_checkpoints(self) -> None:
+        """
+        Wait for queued checkpoint writes and stop the background writer.
+        
+        A failed write is logged rather than raised, so it never masks the
+        workflow's own result or error.
+        """
+        if not self.checkpoint_manager:
+            return
+        
+        try:
+            self.checkpoint_manager.close()
+        except StateRecoveryError as e:
+            logger.error(f"Checkpoint writes failed: {e}")
     
     def recover_from_checkpoint(self, checkpoint_id: str) -> WorkflowState:
         """
@@ -0,0 +1,18 @@
+"""
+Shared pytest configuration.
+
+Hypothesis profiles are registered here, once, so every property test draws
+its example budget from the same place. PR runs use the small "fast" profile;
+the nightly workflow selects "nightly" through ``HYPOTHESIS_PROFILE``.
+"""
+
+import os
+
+from hypothesis import settings
+
+
+# "ci" is avoided as a name: Hypothesis auto-loads its built-in "ci" profile
+# on CI, and re-registering it would silently replace those settings.
+settings.register_profile("fast", max_examples=25, deadline=None)
+settings.register_profile("nightly", max_examples=200, deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "fast"))
@@ -7,7 +7,7 @@ using the Hypothesis property-based testing framework.
 
 import json
 from datetime import datetime
-from hypothesis import given, strategies as st, assume
+from hypothesis import given, settings, strategies as st, assume
 from models import (
     Source,
     Relationship,
@@ -108,6 +108,7 @@ def knowledge_graph_strategy(draw):
 
 # Feature: adversarial-knowledge-cartographer, Property 8: Knowledge graph JSON validity
 @given(knowledge_graph_strategy())
+@settings(max_examples=100)
 def test_property_8_knowledge_graph_json_validity(kg):
     """
     **Feature: adversarial-knowledge-cartographer, Property 8: Knowledge graph JSON validity**
@@ -137,6 +138,7 @@ def test_property_8_knowledge_graph_json_validity(kg):
 
 # Feature: adversarial-knowledge-cartographer, Property 22: Entity uniqueness in graph
 @given(st.lists(non_empty_text_strategy(), min_size=1, max_size=20))
+@settings(max_examples=100)
 def test_property_22_entity_uniqueness_in_graph(entity_list):
     """
     **Feature: adversarial-knowledge-cartographer, Property 22: Entity uniqueness in graph**
@@ -164,6 +166,7 @@ def test_property_22_entity_uniqueness_in_graph(entity_list):
 
 # Feature: adversarial-knowledge-cartographer, Property 23: Relationship field completeness
 @given(relationship_strategy())
+@settings(max_examples=100)
 def test_property_23_relationship_field_completeness(relationship):
     """
     **Feature: adversarial-knowledge-cartographer, Property 23: Relationship field completeness**
@@ -184,6 +187,7 @@ def test_property_23_relationship_field_completeness(relationship):
 
 # Feature: adversarial-knowledge-cartographer, Property 24: Conflict field completeness
 @given(conflict_strategy())
+@settings(max_examples=100)
 def test_property_24_conflict_field_completeness(conflict):
     """
     **Feature: adversarial-knowledge-cartographer, Property 24: Conflict field completeness**
@@ -206,6 +210,7 @@ def test_property_24_conflict_field_completeness(conflict):
 
 # Feature: adversarial-knowledge-cartographer, Property 27: Referential integrity
 @given(knowledge_graph_strategy())
+@settings(max_examples=100)
 def test_property_27_referential_integrity(kg):
     """
     **Feature: adversarial-knowledge-cartographer, Property 27: Referential integrity**
@@ -227,6 +232,7 @@ def test_property_27_referential_integrity(kg):
 
 @given(st.lists(non_empty_text_strategy(), min_size=2, max_size=10, unique=True),
        st.lists(non_empty_text_strategy(), min_size=1, max_size=5))
+@settings(max_examples=100)
 def test_property_27_referential_integrity_violation(entities, invalid_entity_names):
     """
     Test that referential integrity violations are detected.
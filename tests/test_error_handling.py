@@ -4,18 +4,29 @@ Unit tests for error handling utilities.
 Tests exponential backoff logic, graceful degradation, and state recovery.
 """
 
+import asyncio
 import pytest
 import time
+import gzip
 import json
+import random
+import threading
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
+from models.data_models import Source, WorkflowState
 from utils.error_handling import (
     exponential_backoff_retry,
+    Retry,
+    RetryPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
     graceful_degradation,
     StateCheckpoint,
     StateRecoveryError,
     validate_partial_data,
     handle_api_error,
+    is_rate_limit_error,
     RetryableError,
     NonRetryableError
 )
@@ -108,6 +119,197 @@ class TestExponentialBackoff:
         
         assert 0.08 < delay1 < 0.15  # ~0.1s
         assert 0.18 < delay2 < 0.25  # ~0.2s
+    
+    def test_full_jitter_stays_within_cap(self):
+        """Test that jittered backoff is drawn from [0, capped exponential backoff]."""
+        @exponential_backoff_retry(
+            max_retries=5, initial_backoff=1.0, max_backoff=3.0, backoff_factor=2.0
+        )
+        def always_failing_function():
+            raise ValueError("Retry")
+        
+        with patch("utils.error_handling.time.sleep") as mock_sleep:
+            with pytest.raises(ValueError):
+                always_failing_function()
+        
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 4
+        for delay, cap in zip(delays, [1.0, 2.0, 3.0, 3.0]):
+            assert 0.0 <= delay <= cap
+    
+    def test_total_deadline_stops_retrying(self):
+        """Test that a retry whose backoff would exceed the budget is not made."""
+        call_count = 0
+        
+        @exponential_backoff_retry(
+            max_retries=5, initial_backoff=1.0, backoff_factor=2.0, jitter=False,
+            total_deadline=2.5
+        )
+        def always_failing_function():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Retry")
+        
+        # Fake clock that only advances while sleeping
+        clock = [0.0]
+        def fake_sleep(delay):
+            clock[0] += delay
+        
+        # After sleeping 1s, the next 2s delay would end past the 2.5s budget
+        with patch("utils.error_handling.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("utils.error_handling.time.sleep", side_effect=fake_sleep) as mock_sleep:
+            with pytest.raises(ValueError, match="Retry"):
+                always_failing_function()
+        
+        assert call_count == 2
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0]
+
+
+class TestRetry:
+    """Test the shared Retry decorator core."""
+    
+    def test_async_function_is_awaited_and_retried(self):
+        """Test that coroutine functions are retried, not returned unawaited."""
+        call_count = 0
+        
+        @Retry(RetryPolicy(max_attempts=3, initial_backoff=0.01, jitter=False))
+        async def flaky_coroutine():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ValueError("Temporary failure")
+            return "success"
+        
+        assert asyncio.iscoroutinefunction(flaky_coroutine)
+        assert asyncio.run(flaky_coroutine()) == "success"
+        assert call_count == 3
+    
+    def test_rate_limit_only_policy(self):
+        """Test that the rate limit policy retries rate limits and nothing else."""
+        calls = []
+        
+        @Retry(RetryPolicy.rate_limit_only(max_retries=2, base_delay=0.01))
+        def rate_limited():
+            calls.append("rate")
+            raise Exception("429 Too Many Requests")
+        
+        @Retry(RetryPolicy.rate_limit_only(max_retries=2, base_delay=0.01))
+        def broken():
+            calls.append("broken")
+            raise ValueError("Invalid prompt")
+        
+        with pytest.raises(Exception, match="429"):
+            rate_limited()
+        with pytest.raises(ValueError):
+            broken()
+        
+        assert calls == ["rate", "rate", "rate", "broken"]
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker behaviour around retries."""
+    
+    def test_open_circuit_rejects_calls(self):
+        """Test that calls fail fast once the failure threshold is reached."""
+        call_count = 0
+        
+        @exponential_backoff_retry(
+            max_retries=3, initial_backoff=0.01, failure_threshold=2, recovery_time=60.0
+        )
+        def failing_function():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Service down")
+        
+        # The circuit opens on the second failure, so no third attempt is made
+        with pytest.raises(ValueError):
+            failing_function()
+        assert call_count == 2
+        assert failing_function.circuit_breaker.is_open
+        
+        with pytest.raises(CircuitOpenError):
+            failing_function()
+        assert call_count == 2
+    
+    def test_half_open_trial_closes_circuit(self):
+        """Test that a successful trial call after recovery closes the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.05)
+        breaker.record_failure()
+        
+        assert breaker.allow() is False
+        time.sleep(0.06)
+        assert breaker.allow() is True
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow() is False  # only one trial at a time
+        
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow() is True
+    
+    def test_failed_trial_reopens_circuit(self):
+        """Test that a failed trial call re-opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow() is True
+        
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.is_open
+    
+    def test_cancelled_trial_releases_circuit(self):
+        """Test that a cancelled half-open trial does not leave the circuit stuck."""
+        @exponential_backoff_retry(
+            max_retries=1, failure_threshold=1, recovery_time=0.05
+        )
+        async def flaky_function(delay):
+            if delay is None:
+                raise ValueError("Service down")
+            await asyncio.sleep(delay)
+            return "success"
+        
+        async def scenario():
+            with pytest.raises(ValueError):
+                await flaky_function(None)
+            await asyncio.sleep(0.06)
+            # The trial call is cancelled before it reports back
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(flaky_function(1.0), timeout=0.01)
+            return await flaky_function(0)
+        
+        assert asyncio.run(scenario()) == "success"
+        assert flaky_function.circuit_breaker.state == CircuitBreaker.CLOSED
+    
+    def test_stale_trial_expires(self):
+        """Test that a trial which never reports back is replaced after recovery_time."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+        
+        time.sleep(0.06)
+        assert breaker.allow() is True
+    
+    def test_non_retryable_errors_do_not_open_circuit(self):
+        """Test that caller errors are not counted as service failures."""
+        @exponential_backoff_retry(max_retries=3, failure_threshold=1)
+        def bad_request():
+            raise NonRetryableError("Bad request")
+        
+        for _ in range(3):
+            with pytest.raises(NonRetryableError):
+                bad_request()
+        
+        assert bad_request.circuit_breaker.state == CircuitBreaker.CLOSED
+    
+    def test_circuit_breaker_disabled_by_default(self):
+        """Test that exponential_backoff_retry only adds a breaker on request."""
+        @exponential_backoff_retry(max_retries=1)
+        def function():
+            return "success"
+        
+        assert function.circuit_breaker is None
 
 
 class TestGracefulDegradation:
@@ -183,6 +385,32 @@ class TestStateCheckpoint:
         
         assert loaded_state == state
     
+    def test_workflow_state_round_trip(self, checkpoint_manager):
+        """Test that a WorkflowState with sets and datetimes survives a JSON checkpoint."""
+        state = WorkflowState(
+            topic="test topic",
+            iteration=1,
+            sources=[
+                Source(
+                    url="https://example.com/a",
+                    title="Title",
+                    content="Content",
+                    domain="example.com",
+                    retrieved_at=datetime(2024, 1, 1, 12, 30)
+                )
+            ],
+            executed_queries={"query one", "query two"}
+        )
+        
+        checkpoint_manager.save_checkpoint(state, "workflow", format="json")
+        loaded_state = checkpoint_manager.load_checkpoint(
+            "workflow",
+            format="json",
+            state_class=WorkflowState
+        )
+        
+        assert loaded_state == state
+    
     def test_save_and_load_pickle_checkpoint(self, checkpoint_manager):
         """Test saving and loading pickle checkpoints."""
         state = {
@@ -208,6 +436,201 @@ class TestStateCheckpoint:
         
         assert loaded_state == state
     
+    def test_save_and_load_compressed_json_checkpoint(self, checkpoint_manager):
+        """Test saving and loading gzip-compressed JSON checkpoints."""
+        state = {
+            "topic": "test topic",
+            "iteration": 1,
+            "sources": ["source content " * 50] * 10
+        }
+        
+        checkpoint_path = checkpoint_manager.save_checkpoint(
+            state,
+            checkpoint_id="test_checkpoint",
+            format="json.gz"
+        )
+        
+        assert checkpoint_path.name == "test_checkpoint.json.gz"
+        assert checkpoint_path.stat().st_size < len(json.dumps(state))
+        
+        loaded_state = checkpoint_manager.load_checkpoint(
+            checkpoint_id="test_checkpoint",
+            format="json.gz"
+        )
+        
+        assert loaded_state == state
+        assert checkpoint_manager.list_checkpoints() == ["test_checkpoint"]
+        assert checkpoint_manager.delete_checkpoint("test_checkpoint") is True
+        assert not checkpoint_path.exists()
+    
+    def test_load_checkpoint_uses_cache(self, checkpoint_manager):
+        """Test that repeated loads reuse the file's bytes until the file changes."""
+        checkpoint_manager.save_checkpoint({"data": 1}, "cached", format="json")
+        read_bytes = Path.read_bytes
+        
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=read_bytes) as reads:
+            first = checkpoint_manager.load_checkpoint("cached", format="json")
+            first["data"] = 99  # must not leak into the cache
+            second = checkpoint_manager.load_checkpoint("cached", format="json")
+            
+            assert reads.call_count == 1
+            assert second == {"data": 1}
+            
+            # Saving again invalidates the cached entry
+            checkpoint_manager.save_checkpoint({"data": 2}, "cached", format="json")
+            third = checkpoint_manager.load_checkpoint("cached", format="json")
+            
+            assert reads.call_count == 2
+            assert third == {"data": 2}
+    
+    def test_cache_hit_is_cheaper_than_uncached_load(self, checkpoint_manager):
+        """Benchmark: a cache hit beats reading and parsing the file directly."""
+        # Text that compresses like real page content, unlike repeated phrases
+        rng = random.Random(0)
+        words = [
+            "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(2, 10)))
+            for _ in range(5000)
+        ]
+        state = {
+            "sources": [
+                {"url": f"https://source{i}.com", "content": " ".join(rng.choices(words, k=1500))}
+                for i in range(100)
+            ]
+        }
+        checkpoint_path = checkpoint_manager.save_checkpoint(state, "bench", format="json.gz")
+        checkpoint_manager.load_checkpoint("bench", format="json.gz")  # warm the cache
+        
+        def best_of(func, repeats=7):
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                result = func()
+                timings.append(time.perf_counter() - start)
+            return min(timings), result
+        
+        def uncached_load():
+            with gzip.open(checkpoint_path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        
+        hit_time, hit_state = best_of(
+            lambda: checkpoint_manager.load_checkpoint("bench", format="json.gz")
+        )
+        baseline_time, baseline_state = best_of(uncached_load)
+        
+        assert hit_state == baseline_state == state
+        assert hit_time < baseline_time
+    
+    def test_loaded_state_does_not_share_cache(self, checkpoint_manager):
+        """Test that mutating a loaded state object does not change later loads."""
+        class PlainState:
+            def __init__(self, topic, sources):
+                self.topic = topic
+                self.sources = sources
+        
+        checkpoint_manager.save_checkpoint(
+            {"topic": "test topic", "sources": [{"url": "https://a.com"}]},
+            "plain",
+            format="json"
+        )
+        
+        first = checkpoint_manager.load_checkpoint("plain", format="json", state_class=PlainState)
+        first.sources.append({"url": "https://b.com"})
+        first.sources[0]["url"] = "https://changed.com"
+        
+        second = checkpoint_manager.load_checkpoint("plain", format="json", state_class=PlainState)
+        assert second.sources == [{"url": "https://a.com"}]
+    
+    def test_background_writes(self, tmp_path):
+        """Test that queued checkpoints are written and readable after flush."""
+        manager = StateCheckpoint(
+            checkpoint_dir=str(tmp_path / "checkpoints"),
+            background_writes=True
+        )
+        state = {"topic": "test topic", "iteration": 1}
+        
+        checkpoint_path = manager.save_checkpoint(state, "queued", format="json")
+        state["iteration"] = 2  # serialized before queuing, so not persisted
+        manager.flush()
+        
+        assert checkpoint_path.exists()
+        assert list(checkpoint_path.parent.glob("*.tmp")) == []
+        assert manager.load_checkpoint("queued", format="json") == {
+            "topic": "test topic",
+            "iteration": 1
+        }
+    
+    def test_finished_background_writes_are_dropped(self, tmp_path):
+        """Test that completed writes do not accumulate and close() stops the writer."""
+        manager = StateCheckpoint(
+            checkpoint_dir=str(tmp_path / "checkpoints"),
+            background_writes=True
+        )
+        for i in range(5):
+            manager.save_checkpoint({"data": i}, f"checkpoint{i}", format="json")
+        
+        assert len(manager.list_checkpoints()) == 5
+        assert manager._pending == {}
+        
+        manager.close()
+        assert manager._io_pool is None
+        
+        # Still usable after close; a new writer is started on demand
+        manager.save_checkpoint({"data": 5}, "checkpoint5", format="json")
+        manager.close()
+        assert manager.load_checkpoint("checkpoint5", format="json") == {"data": 5}
+    
+    def test_failed_background_write_reported_by_flush(self, tmp_path):
+        """Test that a failed background write is raised from flush() once."""
+        manager = StateCheckpoint(
+            checkpoint_dir=str(tmp_path / "checkpoints"),
+            background_writes=True
+        )
+        
+        with patch("utils.error_handling.os.fsync", side_effect=OSError("disk full")):
+            manager.save_checkpoint({"data": 1}, "lost", format="json")
+            with pytest.raises(StateRecoveryError, match="disk full"):
+                manager.flush()
+        
+        assert manager._pending == {}
+        manager.close()
+    
+    def test_failed_write_keeps_previous_checkpoint(self, checkpoint_manager):
+        """Test that a write failing midway leaves the old checkpoint intact."""
+        checkpoint_manager.save_checkpoint({"data": 1}, "durable", format="json")
+        
+        with patch("utils.error_handling.os.fsync", side_effect=OSError("disk full")):
+            with pytest.raises(StateRecoveryError, match="disk full"):
+                checkpoint_manager.save_checkpoint({"data": 2}, "durable", format="json")
+        
+        assert checkpoint_manager.load_checkpoint("durable", format="json") == {"data": 1}
+        assert list(checkpoint_manager.checkpoint_dir.glob("*.tmp")) == []
+    
+    def test_concurrent_writers_do_not_share_temp_file(self, tmp_path):
+        """Test that managers writing the same checkpoint at once never corrupt it."""
+        managers = [StateCheckpoint(checkpoint_dir=str(tmp_path)) for _ in range(4)]
+        payloads = [{"writer": i, "content": str(i) * 20_000} for i in range(4)]
+        errors = []
+        
+        def write(manager, payload):
+            try:
+                for _ in range(20):
+                    manager.save_checkpoint(payload, "shared_topic", format="json")
+            except StateRecoveryError as e:
+                errors.append(e)
+        
+        threads = [
+            threading.Thread(target=write, args=(manager, payload))
+            for manager, payload in zip(managers, payloads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert managers[0].load_checkpoint("shared_topic", format="json") in payloads
+        assert list(tmp_path.glob("*.tmp")) == []
+    
     def test_list_checkpoints(self, checkpoint_manager):
         """Test listing available checkpoints."""
         # Save multiple checkpoints
@@ -223,6 +646,15 @@ class TestStateCheckpoint:
         assert "checkpoint2" in checkpoints
         assert "checkpoint3" in checkpoints
     
+    def test_list_checkpoints_dedups_formats(self, checkpoint_manager):
+        """Test that an ID saved in several formats is listed once, in sorted order."""
+        checkpoint_manager.save_checkpoint({"data": 1}, "b_checkpoint", format="json")
+        checkpoint_manager.save_checkpoint({"data": 1}, "b_checkpoint", format="pickle")
+        checkpoint_manager.save_checkpoint({"data": 1}, "a_checkpoint", format="json.gz")
+        (checkpoint_manager.checkpoint_dir / "notes.txt").write_text("not a checkpoint")
+        
+        assert checkpoint_manager.list_checkpoints() == ["a_checkpoint", "b_checkpoint"]
+    
     def test_delete_checkpoint(self, checkpoint_manager):
         """Test deleting checkpoints."""
         # Save checkpoint
@@ -327,6 +759,19 @@ class TestValidatePartialData:
         assert is_valid is False
         assert completeness == 1/3
     
+    def test_dict_keys_not_confused_with_methods(self):
+        """Test that dict fields are looked up as keys, not as dict attributes."""
+        data = {"items": [], "values": "present"}
+        
+        is_valid, completeness = validate_partial_data(
+            data,
+            required_fields=["items", "values", "missing"],
+            min_completeness=0.5
+        )
+        
+        assert is_valid is False
+        assert completeness == 1/3
+    
     def test_object_attributes(self):
         """Test validation with object attributes."""
         class TestObject:
@@ -408,6 +853,21 @@ class TestHandleAPIError:
         assert is_retryable is False
         assert backoff is None
     
+    def test_rate_limit_error_by_type(self):
+        """Test that provider rate limit exceptions are detected by type."""
+        openai = pytest.importorskip("openai")
+        response = Mock(status_code=429, headers={})
+        error = openai.RateLimitError("slow down", response=response, body=None)
+        
+        assert is_rate_limit_error(error) is True
+        assert handle_api_error(error) == (True, 60.0)
+    
+    def test_rate_limit_phrases(self):
+        """Test the rate limit phrases reported by the supported providers."""
+        for message in ["Too Many Requests", "rate_limit_exceeded", "Quota exceeded"]:
+            assert is_rate_limit_error(Exception(message)) is True
+        assert is_rate_limit_error(Exception("Connection reset")) is False
+    
     def test_unknown_error(self):
         """Test handling of unknown errors."""
         error = Exception("Something went wrong")
@@ -0,0 +1,106 @@
+"""
+Unit tests for the LLM factory.
+
+Tests client caching in get_llm and the rate limit retry decorator without
+making any API calls.
+"""
+
+import pytest
+from utils import llm_factory
+from utils.error_handling import CircuitBreaker, CircuitOpenError
+from utils.llm_factory import get_llm, with_rate_limit_retry
+
+
+@pytest.fixture
+def openai_config(monkeypatch):
+    """Configure the OpenAI provider with a dummy key and an empty client cache."""
+    monkeypatch.setattr(llm_factory.config, "llm_provider", "openai")
+    monkeypatch.setattr(llm_factory.config, "openai_api_key", "sk-test")
+    llm_factory._cached_llm.cache_clear()
+    yield llm_factory.config
+    llm_factory._cached_llm.cache_clear()
+
+
+class TestGetLLM:
+    """Test LLM client construction and caching."""
+    
+    def test_same_arguments_reuse_client(self, openai_config):
+        """Test that identical requests share one client instance."""
+        assert get_llm() is get_llm()
+        assert get_llm(temperature=0.5, max_tokens=100) is get_llm(max_tokens=100, temperature=0.5)
+    
+    def test_different_arguments_create_new_client(self, openai_config):
+        """Test that different arguments or keys produce different clients."""
+        default_llm = get_llm()
+        
+        assert get_llm(temperature=0.9) is not default_llm
+        
+        openai_config.openai_api_key = "sk-other"
+        assert get_llm() is not default_llm
+    
+    def test_unhashable_arguments_are_not_cached(self, openai_config):
+        """Test that unhashable arguments still construct a client."""
+        first = get_llm(stop=["\n"])
+        second = get_llm(stop=["\n"])
+        
+        assert first is not second
+        assert first.stop == ["\n"]
+    
+    def test_provider_class_is_loaded_lazily_once(self, openai_config):
+        """Test that the provider class comes from the memoized loader."""
+        from langchain_openai import ChatOpenAI
+        
+        assert isinstance(get_llm(), ChatOpenAI)
+        assert llm_factory._load_openai() is ChatOpenAI
+        assert llm_factory._load_openai.cache_info().hits >= 1
+    
+    def test_missing_api_key(self, openai_config):
+        """Test that a missing API key raises ValueError."""
+        openai_config.openai_api_key = None
+        
+        with pytest.raises(ValueError, match="OpenAI API key not configured"):
+            get_llm()
+
+
+class TestWithRateLimitRetry:
+    """Test the rate limit retry decorator's circuit breaker."""
+    
+    def test_open_circuit_stops_calls(self):
+        """Test that a failure through one call site opens the shared circuit for all."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=60.0)
+        calls = []
+        
+        @with_rate_limit_retry(base_delay=0, breaker=breaker)
+        def invoke():
+            calls.append("invoke")
+            raise RuntimeError("service unavailable")
+        
+        @with_rate_limit_retry(base_delay=0, breaker=breaker)
+        def stream():
+            calls.append("stream")
+            return "ok"
+        
+        with pytest.raises(RuntimeError):
+            invoke()
+        assert breaker.is_open
+        
+        with pytest.raises(CircuitOpenError):
+            stream()
+        with pytest.raises(CircuitOpenError):
+            invoke()
+        assert calls == ["invoke"]
+    
+    def test_no_circuit_breaker_by_default(self):
+        """Test that the decorator keeps calling through failures without a breaker."""
+        @with_rate_limit_retry(base_delay=0)
+        def invoke():
+            raise RuntimeError("service unavailable")
+        
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                invoke()
+        assert invoke.circuit_breaker is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,247 @@
+"""
+Unit tests for structured logging utilities.
+
+Tests the structured formatter and the log_* helper functions.
+"""
+
+import logging
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
+import pytest
+from unittest.mock import Mock
+from utils import logging_config
+from utils.logging_config import (
+    ContextFilter,
+    LogContext,
+    StructuredFormatter,
+    setup_logging,
+    shutdown_logging,
+    log_entity_extraction,
+    log_phase_completion,
+    log_source_collection
+)
+
+
+class _RecordingHandler(logging.Handler):
+    """Handler that keeps emitted records in a list."""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def isolated_logger():
+    """A DEBUG logger that records to its own handler instead of the root logger."""
+    logger = logging.getLogger("test.logging_config")
+    handler = _RecordingHandler()
+    handler.addFilter(ContextFilter())
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger, handler.records
+    logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+
+class TestLogHelpers:
+    """Test the structured log helper functions."""
+    
+    def test_messages_are_formatted_lazily(self, isolated_logger):
+        """Test that helpers pass %-style arguments and still render correctly."""
+        logger, records = isolated_logger
+        
+        log_entity_extraction(logger, 12, "mapper")
+        log_source_collection(logger, 20, 7, "scout")
+        log_phase_completion(logger, "judge", 2, sources=5, conflicts=1)
+        
+        entity_record, source_record, phase_record = records
+        assert entity_record.msg == "Extracted %d entities"
+        assert entity_record.getMessage() == "Extracted 12 entities"
+        assert source_record.getMessage() == "Collected 20 sources from 7 unique domains"
+        assert phase_record.getMessage() == "Phase completed: sources=5, conflicts=1"
+        assert phase_record.phase == "judge"
+        assert phase_record.iteration == 2
+    
+    def test_phase_completion_skipped_when_disabled(self):
+        """Test that no metrics summary is built when INFO is disabled."""
+        logger = Mock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = False
+        
+        log_phase_completion(logger, "scout", 1, sources=10)
+        
+        logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        logger.info.assert_not_called()
+
+
+class TestLogContext:
+    """Test context-scoped structured fields."""
+    
+    def test_nested_contexts(self, isolated_logger):
+        """Test that nested contexts merge fields and restore them on exit."""
+        logger, records = isolated_logger
+        
+        with LogContext(phase="scout", iteration=1):
+            logger.info("outer")
+            with LogContext(phase="mapper", agent="mapper"):
+                logger.info("inner")
+            logger.info("outer again")
+        logger.info("outside")
+        
+        outer, inner, outer_again, outside = records
+        assert (outer.phase, outer.iteration) == ("scout", 1)
+        assert (inner.phase, inner.iteration, inner.agent) == ("mapper", 1, "mapper")
+        assert outer_again.phase == "scout" and not hasattr(outer_again, "agent")
+        assert not hasattr(outside, "phase")
+    
+    def test_explicit_extra_wins(self, isolated_logger):
+        """Test that fields passed via extra override the context."""
+        logger, records = isolated_logger
+        
+        with LogContext(phase="scout"):
+            logger.info("message", extra={'phase': "judge"})
+        
+        assert records[0].phase == "judge"
+    
+    def test_fields_reach_caplog_without_setup(self, caplog):
+        """Test that context fields are on records however logging is configured."""
+        logger = logging.getLogger("test.caplog")
+        
+        with caplog.at_level(logging.INFO, logger="test.caplog"):
+            with LogContext(phase="scout", iteration=1):
+                logger.info("from context")
+                logger.info("explicit", extra={'phase': "judge"})
+        
+        context_record, explicit_record = caplog.records
+        assert (context_record.phase, context_record.iteration) == ("scout", 1)
+        assert (explicit_record.phase, explicit_record.iteration) == ("judge", 1)
+        assert not hasattr(context_record, "agent")
+    
+    def test_contexts_are_isolated_between_threads(self, isolated_logger):
+        """Test that one thread's context does not leak into another."""
+        logger, records = isolated_logger
+        entered = threading.Event()
+        logged = threading.Event()
+        
+        def worker():
+            with LogContext(agent="worker"):
+                entered.set()
+                logged.wait(timeout=5)
+        
+        thread = threading.Thread(target=worker)
+        thread.start()
+        entered.wait(timeout=5)
+        logger.info("main thread")
+        logged.set()
+        thread.join()
+        
+        assert not hasattr(records[0], "agent")
+
+
+class TestSetupLogging:
+    """Test root logger configuration."""
+    
+    @pytest.fixture
+    def restore_root_logger(self):
+        """Restore the root logger's handlers and level after the test."""
+        root_logger = logging.getLogger()
+        handlers, level = root_logger.handlers[:], root_logger.level
+        yield root_logger
+        shutdown_logging()
+        # setup_logging() stopped the listener behind any earlier queue
+        # handler, so only handlers that still work are put back
+        root_logger.handlers[:] = [h for h in handlers if not isinstance(h, QueueHandler)]
+        root_logger.setLevel(level)
+    
+    def test_records_reach_file_through_queue(self, restore_root_logger, tmp_path):
+        """Test that queued records are written with context once flushed."""
+        log_file = tmp_path / "logs" / "app.log"
+        setup_logging("INFO", log_file=str(log_file), log_format="%(message)s")
+        
+        assert [type(h) for h in restore_root_logger.handlers] == [QueueHandler]
+        
+        with LogContext(agent="scout"):
+            logging.getLogger("test.setup").info("Found %d sources", 3)
+        shutdown_logging()
+        
+        assert "[scout] Found 3 sources" in log_file.read_text(encoding="utf-8")
+    
+    def test_records_after_shutdown_are_not_lost(self, restore_root_logger, capsys):
+        """Test that shutdown detaches the queue so later records still get printed."""
+        setup_logging("INFO", log_format="%(message)s")
+        shutdown_logging()
+        
+        assert restore_root_logger.handlers == []
+        logging.getLogger("test.setup").warning("logged after shutdown")
+        
+        assert "logged after shutdown" in capsys.readouterr().err
+    
+    def test_log_file_is_buffered_until_error(self, restore_root_logger, tmp_path):
+        """Test that file output is batched but flushed as soon as an ERROR arrives."""
+        log_file = tmp_path / "app.log"
+        setup_logging("INFO", log_file=str(log_file), log_format="%(message)s")
+        logger = logging.getLogger("test.setup")
+        
+        file_handler = logging_config._listener.handlers[-1].target
+        assert isinstance(file_handler, RotatingFileHandler)
+        assert file_handler.maxBytes == logging_config.LOG_FILE_MAX_BYTES
+        
+        logger.info("buffered message")
+        logger.error("urgent message")
+        
+        # The listener writes asynchronously; the ERROR flushes the buffer
+        # without waiting for shutdown
+        deadline = time.monotonic() + 5
+        while "urgent message" not in log_file.read_text(encoding="utf-8"):
+            assert time.monotonic() < deadline, "ERROR record was not flushed"
+            time.sleep(0.01)
+        
+        assert "buffered message\nurgent message" in log_file.read_text(encoding="utf-8")
+
+
+class TestStructuredFormatter:
+    """Test the structured log formatter."""
+    
+    def test_prefixes_structured_fields(self):
+        """Test that agent, iteration and phase fields prefix the message."""
+        formatter = StructuredFormatter("%(message)s")
+        record = logging.LogRecord(
+            "test", logging.INFO, __file__, 1, "Found %d sources", (3,), None
+        )
+        record.agent = "scout"
+        record.iteration = 1
+        record.phase = "search"
+        
+        assert formatter.format(record) == "[scout] [iter=1] [search] Found 3 sources"
+    
+    def test_leaves_record_unchanged(self):
+        """Test that formatting twice does not repeat the prefix."""
+        formatter = StructuredFormatter("%(message)s")
+        record = logging.LogRecord(
+            "test", logging.INFO, __file__, 1, "Found %d sources", (3,), None
+        )
+        record.phase = "100% search"
+        
+        assert formatter.format(record) == "[100% search] Found 3 sources"
+        assert formatter.format(record) == "[100% search] Found 3 sources"
+        assert record.msg == "Found %d sources"
+    
+    def test_prefixes_context_fields(self):
+        """Test that LogContext fields are used without a ContextFilter."""
+        formatter = StructuredFormatter("%(message)s")
+        
+        with LogContext(agent="mapper"):
+            record = logging.getLogRecordFactory()(
+                "test", logging.INFO, __file__, 1, "Mapped", (), None
+            )
+        
+        assert formatter.format(record) == "[mapper] Mapped"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
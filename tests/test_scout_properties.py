@@ -5,14 +5,55 @@ These tests validate universal properties that should hold for source collection
 diversity, and state transitions.
 """
 
+import random
+import re
+from functools import lru_cache
+from operator import attrgetter
+
 import pytest
-from hypothesis import given, strategies as st, assume, settings
+from hypothesis import given, strategies as st, settings
 from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
+import agents.scout as scout_module
 from agents.scout import ScoutAgent, SearchAPIError
 from models.data_models import Source, WorkflowState, KnowledgeGraph
 
 
+# The seeded cases follow the active Hypothesis profile (see conftest.py)
+_MAX_EXAMPLES = settings().max_examples
+
+# Matches any Unicode letter or digit, i.e. the same characters as str.isalnum()
+_ALNUM_RE = re.compile(r"[^\W_]")
+
+# Generated sources only need a valid timestamp, not the current time
+_FIXED_TS = datetime(2024, 1, 1)
+
+_get_domain = attrgetter("domain")
+
+_BASE_STATE = WorkflowState(topic="x", iteration=0, current_phase="scout")
+
+
+def _fresh_state(**update) -> WorkflowState:
+    """
+    Copy the base state without re-running Pydantic validation.
+    
+    Scout appends to ``sources`` and ``executed_queries`` in place, so every
+    copy gets its own containers.
+    """
+    update.setdefault("sources", [])
+    update.setdefault("executed_queries", set())
+    return _BASE_STATE.model_copy(update=update)
+
+
+def _extract_fallback(url, fallback_content=None):
+    """
+    Stand-in for ScoutAgent.extract_content.
+    
+    Scout passes each result's snippet as ``fallback_content``, so returning it
+    yields the same content as looking the result up by URL.
+    """
+    return fallback_content
+
+
 # Helper strategies for generating test data
 @st.composite
 def source_strategy(draw):
@@ -23,31 +64,179 @@ def source_strategy(draw):
         title=draw(st.text(min_size=5, max_size=100)),
         content=draw(st.text(min_size=100, max_size=1000)),
         domain=f"{domain}.com",
-        retrieved_at=datetime.now(),
+        retrieved_at=_FIXED_TS,
         query_used=draw(st.text(min_size=3, max_size=50))
     )
 
 
-@st.composite
-def search_result_strategy(draw, domain=None):
-    """Generate a mock search result."""
-    if domain is None:
-        domain = draw(st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=3, max_size=15))
+# Topics need at least one letter or digit; filtering at generation time
+# keeps rejected examples out of the test body entirely.
+_TOPIC_STRATEGY = st.text(min_size=5, max_size=50).filter(
+    lambda s: _ALNUM_RE.search(s) is not None
+)
+
+
+# Enough distinct domains for the largest result batch generated below
+_DOMAINS = tuple(f"domain{i}" for i in range(20))
+
+# Alphabet for the seeded fuzz cases: letters, digits, punctuation, whitespace
+# and a few non-ASCII characters
+_FUZZ_ALPHABET = (
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    " \t\n.,;:!?-_'\"éßΩ中"
+)
+
+# Blank and whitespace-only values that Scout must reject. Random text almost
+# never produces them, so every third result gets a blank title and every
+# third (offset by one) a blank content
+_BLANK_FIELDS = ("", " ", "\t\n ")
+
+
+@lru_cache(maxsize=None)
+def _domain_content(domain: str) -> tuple:
+    """Return the (content, raw_content) pair for a domain, built once per domain."""
+    return (
+        f"This is content from {domain}. " * 20,  # Sufficient length
+        f"Raw content from {domain}. " * 30
+    )
+
+
+def _make_results(count: int) -> list:
+    """Build ``count`` search results, each from a distinct domain."""
+    results = []
+    for i, domain in enumerate(_DOMAINS[:count]):
+        content, raw_content = _domain_content(domain)
+        results.append({
+            "url": f"https://{domain}.com/article",
+            "title": f"Article {i} from {domain}",
+            "content": content,
+            "raw_content": raw_content
+        })
+    return results
+
+
+def _run_scout(
+    topic: str,
+    mock_results: list,
+    min_sources: int,
+    max_sources_per_query: int,
+    validate_sources: bool = True
+) -> WorkflowState:
+    """
+    Run a Scout agent over canned search results and return the updated state.
+    
+    Pass ``validate_sources=False`` only for results that are valid by
+    construction: Scout then builds Source objects with ``model_construct``,
+    skipping the field validators. Tests that rely on Scout rejecting invalid
+    sources must keep validation on.
+    """
+    scout = ScoutAgent(min_sources=min_sources, max_sources_per_query=max_sources_per_query)
+    scout.search = lambda *args, **kwargs: mock_results
+    # Result content reaches Scout as the extraction fallback
+    scout.extract_content = _extract_fallback
+    
+    with pytest.MonkeyPatch.context() as mp:
+        if not validate_sources:
+            mp.setattr(scout_module, "Source", Source.model_construct)
+        return scout.execute(_fresh_state(topic=topic))
+
+
+def _check_diversity(updated_state: WorkflowState) -> None:
+    """Property 3: at least 10 sources, all from unique domains."""
+    collected_domains = set(map(_get_domain, updated_state.sources))
+    
+    # Should have at least 10 unique domains
+    assert len(collected_domains) >= 10, (
+        f"Expected at least 10 unique domains, got {len(collected_domains)}"
+    )
+    
+    # All domains should be unique (no duplicates)
+    assert len(collected_domains) == len(updated_state.sources), (
+        "Sources should all have unique domains"
+    )
+
+
+def _is_complete(source: Source) -> bool:
+    """True when every required field is non-blank and retrieved_at is a datetime."""
+    return bool(
+        source.url and source.url.strip()
+        and source.title and source.title.strip()
+        and source.content and source.content.strip()
+        and source.domain and source.domain.strip()
+        and isinstance(source.retrieved_at, datetime)
+    )
+
+
+def _check_completeness(updated_state: WorkflowState) -> None:
+    """Property 4: every collected source has non-empty fields."""
+    incomplete = [source for source in updated_state.sources if not _is_complete(source)]
+    assert not incomplete, f"Incomplete sources: {incomplete[:3]}"
+
+
+def _check_transition(updated_state: WorkflowState, topic: str) -> None:
+    """Property 5: collected sources are handed to the Mapper via the state."""
+    # 1. Sources should be added to the (initially empty) state
+    assert len(updated_state.sources) > 0, (
+        "Scout should add sources to the state"
+    )
+    
+    # 2. Sources should be valid Source objects
+    for source in updated_state.sources:
+        assert isinstance(source, Source), (
+            f"All items in state.sources should be Source objects, got {type(source)}"
+        )
+    
+    # 3. State should maintain topic
+    assert updated_state.topic == topic, (
+        "State topic should be preserved through Scout phase"
+    )
+    
+    # 4. Status message should be updated
+    assert updated_state.status_message is not None, (
+        "Scout should update status message"
+    )
+    assert "Scout" in updated_state.status_message or "sources" in updated_state.status_message, (
+        "Status message should indicate Scout completion"
+    )
+
+
+def _random_text(rng: random.Random, min_size: int, max_size: int) -> str:
+    """Draw a string of random length from the fuzz alphabet."""
+    return "".join(rng.choices(_FUZZ_ALPHABET, k=rng.randint(min_size, max_size)))
+
+
+def _random_topic(rng: random.Random) -> str:
+    """Draw a 5-50 character topic containing at least one letter or digit."""
+    return rng.choice("abcdefghijklmnopqrstuvwxyz0123456789") + _random_text(rng, 4, 49)
+
+
+def _random_search_result(rng: random.Random, index: int) -> dict:
+    """Draw a search result; see _BLANK_FIELDS for which fields are blanked."""
+    domain = "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 15)))
+    title = _random_text(rng, 10, 100)
+    content = _random_text(rng, 100, 500)
+    raw_content = _random_text(rng, 200, 1000)
+    
+    if index % 3 == 1:
+        title = rng.choice(_BLANK_FIELDS)
+    elif index % 3 == 2:
+        # Scout falls back to raw_content for an empty snippet
+        content = raw_content = rng.choice(_BLANK_FIELDS)
     
     return {
-        "url": f"https://{domain}.com/article-{draw(st.integers(min_value=1, max_value=1000))}",
-        "title": draw(st.text(min_size=10, max_size=100)),
-        "content": draw(st.text(min_size=100, max_size=500)),
-        "raw_content": draw(st.text(min_size=200, max_size=1000))
+        "url": f"https://{domain}.com/article-{rng.randint(1, 1000)}",
+        "title": title,
+        "content": content,
+        "raw_content": raw_content
     }
 
 
 # Property 3: Scout phase source diversity
 @given(
     st.integers(min_value=10, max_value=20),  # Number of unique domains
-    st.text(min_size=5, max_size=50)  # Topic
+    _TOPIC_STRATEGY  # Topic
 )
-@settings(max_examples=50, deadline=None)
+@settings(database=None)
 def test_property_3_scout_phase_source_diversity(num_domains: int, topic: str):
     """
     Feature: adversarial-knowledge-cartographer, Property 3: 
@@ -58,64 +247,16 @@ def test_property_3_scout_phase_source_diversity(num_domains: int, topic: str):
     
     Validates: Requirements 2.2
     """
-    assume(any(c.isalnum() for c in topic))
-    
-    # Create mock search results with unique domains
-    mock_results = []
-    domains = [f"domain{i}" for i in range(num_domains)]
-    
-    for i, domain in enumerate(domains):
-        mock_results.append({
-            "url": f"https://{domain}.com/article",
-            "title": f"Article {i} from {domain}",
-            "content": f"This is content from {domain}. " * 20,  # Sufficient length
-            "raw_content": f"Raw content from {domain}. " * 30
-        })
-    
-    # Create Scout agent
-    scout = ScoutAgent(min_sources=10, max_sources_per_query=num_domains)
-    
-    # Mock the search method to return our controlled results
-    with patch.object(scout, 'search', return_value=mock_results):
-        # Mock extract_content to return the content from results
-        def mock_extract(url, fallback_content=None):
-            for result in mock_results:
-                if result["url"] == url:
-                    return result["content"]
-            return fallback_content
-        
-        with patch.object(scout, 'extract_content', side_effect=mock_extract):
-            # Create initial state
-            state = WorkflowState(
-                topic=topic,
-                iteration=0,
-                current_phase="scout"
-            )
-            
-            # Execute Scout agent
-            updated_state = scout.execute(state)
-            
-            # Verify source diversity
-            collected_domains = {source.domain for source in updated_state.sources}
-            
-            # Should have at least 10 unique domains
-            assert len(collected_domains) >= 10, (
-                f"Expected at least 10 unique domains, got {len(collected_domains)}"
-            )
-            
-            # All domains should be unique (no duplicates)
-            assert len(collected_domains) == len(updated_state.sources), (
-                "Sources should all have unique domains"
-            )
+    updated_state = _run_scout(
+        topic, _make_results(num_domains), 10, num_domains,
+        validate_sources=False
+    )
+    _check_diversity(updated_state)
 
 
 # Property 4: Source completeness
-@given(
-    st.lists(search_result_strategy(), min_size=1, max_size=15),
-    st.text(min_size=5, max_size=50)
-)
-@settings(max_examples=50, deadline=None)
-def test_property_4_source_completeness(search_results: list, topic: str):
+@pytest.mark.parametrize("case", range(_MAX_EXAMPLES))
+def test_property_4_source_completeness(case: int):
     """
     Feature: adversarial-knowledge-cartographer, Property 4: 
     Source completeness
@@ -125,64 +266,17 @@ def test_property_4_source_completeness(search_results: list, topic: str):
     
     Validates: Requirements 2.3
     """
-    assume(any(c.isalnum() for c in topic))
-    assume(len(search_results) > 0)
-    
-    # Create Scout agent
-    scout = ScoutAgent(min_sources=5, max_sources_per_query=15)
-    
-    # Mock the search method
-    with patch.object(scout, 'search', return_value=search_results):
-        # Mock extract_content to return content from results
-        def mock_extract(url, fallback_content=None):
-            for result in search_results:
-                if result["url"] == url:
-                    return result.get("content") or result.get("raw_content") or fallback_content
-            return fallback_content
-        
-        with patch.object(scout, 'extract_content', side_effect=mock_extract):
-            # Create initial state
-            state = WorkflowState(
-                topic=topic,
-                iteration=0,
-                current_phase="scout"
-            )
-            
-            # Execute Scout agent
-            updated_state = scout.execute(state)
-            
-            # Verify all collected sources have complete fields
-            for source in updated_state.sources:
-                # URL should be non-empty
-                assert source.url, f"Source URL is empty"
-                assert source.url.strip(), f"Source URL is whitespace only"
-                
-                # Title should be non-empty
-                assert source.title, f"Source title is empty for {source.url}"
-                assert source.title.strip(), f"Source title is whitespace only for {source.url}"
-                
-                # Content should be non-empty
-                assert source.content, f"Source content is empty for {source.url}"
-                assert source.content.strip(), f"Source content is whitespace only for {source.url}"
-                
-                # Domain should be non-empty
-                assert source.domain, f"Source domain is empty for {source.url}"
-                assert source.domain.strip(), f"Source domain is whitespace only for {source.url}"
-                
-                # Retrieved_at should be set
-                assert source.retrieved_at is not None, f"Source retrieved_at is None for {source.url}"
-                assert isinstance(source.retrieved_at, datetime), (
-                    f"Source retrieved_at is not a datetime for {source.url}"
-                )
+    rng = random.Random(42 + case)
+    search_results = [_random_search_result(rng, i) for i in range(rng.randint(3, 15))]
+    topic = _random_topic(rng)
+    
+    updated_state = _run_scout(topic, search_results, min_sources=5, max_sources_per_query=15)
+    _check_completeness(updated_state)
 
 
 # Property 5: Scout to Mapper state transition
-@given(
-    st.integers(min_value=5, max_value=20),  # Number of sources
-    st.text(min_size=5, max_size=50)  # Topic
-)
-@settings(max_examples=50, deadline=None)
-def test_property_5_scout_to_mapper_state_transition(num_sources: int, topic: str):
+@pytest.mark.parametrize("case", range(_MAX_EXAMPLES))
+def test_property_5_scout_to_mapper_state_transition(case: int):
     """
     Feature: adversarial-knowledge-cartographer, Property 5: 
     Scout to Mapper state transition
@@ -192,72 +286,15 @@ def test_property_5_scout_to_mapper_state_transition(num_sources: int, topic: st
     
     Validates: Requirements 2.5
     """
-    assume(any(c.isalnum() for c in topic))
-    
-    # Create mock search results
-    mock_results = []
-    for i in range(num_sources):
-        mock_results.append({
-            "url": f"https://domain{i}.com/article",
-            "title": f"Article {i}",
-            "content": f"Content for article {i}. " * 20,
-            "raw_content": f"Raw content for article {i}. " * 30
-        })
+    rng = random.Random(42 + case)
+    num_sources = rng.randint(5, 20)
+    topic = _random_topic(rng)
     
-    # Create Scout agent
-    scout = ScoutAgent(min_sources=5, max_sources_per_query=num_sources)
-    
-    # Mock the search method
-    with patch.object(scout, 'search', return_value=mock_results):
-        # Mock extract_content
-        def mock_extract(url, fallback_content=None):
-            for result in mock_results:
-                if result["url"] == url:
-                    return result["content"]
-            return fallback_content
-        
-        with patch.object(scout, 'extract_content', side_effect=mock_extract):
-            # Create initial state (before Scout)
-            initial_state = WorkflowState(
-                topic=topic,
-                iteration=0,
-                current_phase="initialized"
-            )
-            
-            initial_source_count = len(initial_state.sources)
-            
-            # Execute Scout agent
-            updated_state = scout.execute(initial_state)
-            
-            # Verify state transition properties
-            # 1. Sources should be added to the state
-            assert len(updated_state.sources) > initial_source_count, (
-                "Scout should add sources to the state"
-            )
-            
-            # 2. All sources should be accessible in the state
-            assert len(updated_state.sources) > 0, (
-                "State should contain collected sources"
-            )
-            
-            # 3. Sources should be valid Source objects
-            for source in updated_state.sources:
-                assert isinstance(source, Source), (
-                    f"All items in state.sources should be Source objects, got {type(source)}"
-                )
-            
-            # 4. State should maintain topic
-            assert updated_state.topic == topic, (
-                "State topic should be preserved through Scout phase"
-            )
-            
-            # 5. Status message should be updated
-            assert updated_state.status_message is not None, (
-                "Scout should update status message"
-            )
-            assert "Scout" in updated_state.status_message or "sources" in updated_state.status_message, (
-                "Status message should indicate Scout completion"
-            )
+    updated_state = _run_scout(
+        topic, _make_results(num_sources), 5, num_sources,
+        validate_sources=False
+    )
+    _check_transition(updated_state, topic)
 
 
 # Edge case tests
@@ -265,18 +302,15 @@ def test_scout_handles_empty_search_results():
     """Test that Scout handles empty search results gracefully."""
     scout = ScoutAgent(min_sources=10)
     
-    with patch.object(scout, 'search', return_value=[]):
-        state = WorkflowState(
-            topic="test topic",
-            iteration=0,
-            current_phase="scout"
-        )
-        
-        updated_state = scout.execute(state)
-        
-        # Should not crash, but may have no sources
-        assert isinstance(updated_state, WorkflowState)
-        assert len(updated_state.sources) == 0
+    scout.search = lambda *args, **kwargs: []
+    
+    state = _fresh_state(topic="test topic")
+    
+    updated_state = scout.execute(state)
+    
+    # Should not crash, but may have no sources
+    assert isinstance(updated_state, WorkflowState)
+    assert len(updated_state.sources) == 0
 
 
 def test_scout_filters_duplicate_domains():
@@ -293,21 +327,18 @@ def test_scout_filters_duplicate_domains():
          "content": "Content 3 " * 20, "raw_content": "Raw 3 " * 30},
     ]
     
-    with patch.object(scout, 'search', return_value=mock_results):
-        with patch.object(scout, 'extract_content', side_effect=lambda url, fallback_content=None: fallback_content):
-            state = WorkflowState(
-                topic="test topic",
-                iteration=0,
-                current_phase="scout"
-            )
-            
-            updated_state = scout.execute(state)
-            
-            # Should only have 2 sources (one from example.com, one from other.com)
-            domains = {source.domain for source in updated_state.sources}
-            assert len(domains) == len(updated_state.sources), (
-                "Should not have duplicate domains"
-            )
+    scout.search = lambda *args, **kwargs: mock_results
+    scout.extract_content = _extract_fallback
+    
+    state = _fresh_state(topic="test topic")
+    
+    updated_state = scout.execute(state)
+    
+    # Should only have 2 sources (one from example.com, one from other.com)
+    domains = set(map(_get_domain, updated_state.sources))
+    assert len(domains) == len(updated_state.sources), (
+        "Should not have duplicate domains"
+    )
 
 
 def test_scout_skips_paywalled_content():
@@ -323,19 +354,16 @@ def test_scout_skips_paywalled_content():
          "raw_content": "Free content " * 30},
     ]
     
-    with patch.object(scout, 'search', return_value=mock_results):
-        with patch.object(scout, 'extract_content', side_effect=lambda url, fallback_content=None: fallback_content):
-            state = WorkflowState(
-                topic="test topic",
-                iteration=0,
-                current_phase="scout"
-            )
-            
-            updated_state = scout.execute(state)
-            
-            # Should only collect the free article
-            assert len(updated_state.sources) == 1
-            assert updated_state.sources[0].domain == "free.com"
+    scout.search = lambda *args, **kwargs: mock_results
+    scout.extract_content = _extract_fallback
+    
+    state = _fresh_state(topic="test topic")
+    
+    updated_state = scout.execute(state)
+    
+    # Should only collect the free article
+    assert len(updated_state.sources) == 1
+    assert updated_state.sources[0].domain == "free.com"
 
 
 def test_scout_handles_extraction_failures():
@@ -349,25 +377,23 @@ def test_scout_handles_extraction_failures():
          "content": "", "raw_content": ""},  # Empty content
     ]
     
-    with patch.object(scout, 'search', return_value=mock_results):
-        # Mock extract_content to return None for bad.com
-        def mock_extract(url, fallback_content=None):
-            if "bad.com" in url:
-                return None
-            return fallback_content
-        
-        with patch.object(scout, 'extract_content', side_effect=mock_extract):
-            state = WorkflowState(
-                topic="test topic",
-                iteration=0,
-                current_phase="scout"
-            )
-            
-            updated_state = scout.execute(state)
-            
-            # Should only collect the good article
-            assert len(updated_state.sources) == 1
-            assert updated_state.sources[0].domain == "good.com"
+    scout.search = lambda *args, **kwargs: mock_results
+    
+    # Stub extract_content to return None for bad.com
+    def mock_extract(url, fallback_content=None):
+        if "bad.com" in url:
+            return None
+        return fallback_content
+    
+    scout.extract_content = mock_extract
+    
+    state = _fresh_state(topic="test topic")
+    
+    updated_state = scout.execute(state)
+    
+    # Should only collect the good article
+    assert len(updated_state.sources) == 1
+    assert updated_state.sources[0].domain == "good.com"
 
 
 def test_scout_uses_adversarial_queries_in_later_iterations():
@@ -379,21 +405,27 @@ def test_scout_uses_adversarial_queries_in_later_iterations():
          "content": "Content " * 20, "raw_content": "Raw " * 30},
     ]
     
-    with patch.object(scout, 'search', return_value=mock_results) as mock_search:
-        with patch.object(scout, 'extract_content', side_effect=lambda url, fallback_content=None: fallback_content):
-            state = WorkflowState(
-                topic="original topic",
-                iteration=1,  # Not first iteration
-                current_phase="scout",
-                adversarial_queries=["adversarial query 1", "adversarial query 2"]
-            )
-            
-            updated_state = scout.execute(state)
-            
-            # Verify that search was called with adversarial queries
-            assert mock_search.called
-            # At least one call should use an adversarial query
-            call_args = [call[0][0] for call in mock_search.call_args_list]
-            assert any(q in state.adversarial_queries for q in call_args), (
-                "Scout should use adversarial queries in later iterations"
-            )
+    # Record queries with a plain function rather than a MagicMock
+    calls = []
+    
+    def rec_search(query, *args, **kwargs):
+        calls.append(query)
+        return mock_results
+    
+    scout.search = rec_search
+    scout.extract_content = _extract_fallback
+    
+    state = _fresh_state(
+        topic="original topic",
+        iteration=1,  # Not first iteration
+        adversarial_queries=["adversarial query 1", "adversarial query 2"]
+    )
+    
+    updated_state = scout.execute(state)
+    
+    # Verify that search was called with adversarial queries
+    assert calls
+    # At least one call should use an adversarial query
+    assert any(q in state.adversarial_queries for q in calls), (
+        "Scout should use adversarial queries in later iterations"
+    )
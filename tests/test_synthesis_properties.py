@@ -7,21 +7,194 @@ These tests validate the correctness properties defined in the design document:
 - Property 21: Report structure completeness
 """
 
+import re
+from functools import lru_cache
+
 import pytest
-from hypothesis import given, strategies as st, assume, settings
-from datetime import datetime, timedelta
+from hypothesis import given, strategies as st
 import json
 
 from agents.synthesis import SynthesisAgent
 from models.data_models import (
     KnowledgeGraph,
     Relationship,
-    Conflict,
-    WorkflowState
+    Conflict
 )
 
 
+class _MockLLM:
+    """Placeholder LLM for code paths that never call the model."""
+    pass
+
+
+class _MockResponse:
+    """Static LLM response containing the three narrative report sections."""
+    content = """# The Consensus
+
+Based on the analysis of sources, the following points show strong agreement:
+- Key finding 1
+- Key finding 2
+
+# The Battleground
+
+The following topics show significant disagreement:
+- Conflict 1: Different perspectives exist
+- Conflict 2: Sources disagree on methodology
+
+# The Verdict
+
+Based on credibility analysis:
+- For Conflict 1: Side A is more likely correct
+- For Conflict 2: Insufficient evidence to determine"""
+
+
+class _ReportMockLLM:
+    """LLM stub that always returns the static synthesis response."""
+    
+    def invoke(self, messages):
+        return _MockResponse()
+
+
+_MOCK_LLM = _MockLLM()
+_REPORT_MOCK_LLM = _ReportMockLLM()
+
+
+@lru_cache(maxsize=8)
+def _agent(llm=_MOCK_LLM, consensus_threshold=0.9):
+    """
+    Return a shared SynthesisAgent for this LLM stub and threshold.
+    
+    The agent keeps no per-call state, so one instance can serve every example.
+    """
+    return SynthesisAgent(consensus_threshold=consensus_threshold, llm=llm)
+
+
+_REPORT_SECTIONS = re.compile(
+    r"consensus.*?battleground.*?verdict.*?knowledge graph.*?json", re.DOTALL
+)
+
+
+
+
 # Custom strategies for generating test data
+RELATIONS = ("supports", "contradicts", "relates_to", "causes")
+_RELATIONS = st.sampled_from(RELATIONS)
+_RELATIONS3 = st.sampled_from(RELATIONS[:3])
+
+# The report test never inspects the topic, so a few fixed values suffice
+_TOPICS = st.sampled_from((
+    "AI safety",
+    "climate change",
+    "COVID-19",
+    "quantum computing",
+    "machine learning"
+))
+
+# Strategies are built once here rather than inside every draw() call
+_CRED_HIGH = st.floats(min_value=0.6, max_value=1.0)
+_CRED_MID = st.floats(min_value=0.3, max_value=0.9)
+_CRED_WIDE = st.floats(min_value=0.3, max_value=1.0)
+_NUM_ENTITIES = st.integers(min_value=5, max_value=15)
+_NUM_CONSENSUS = st.integers(min_value=2, max_value=3)
+_NUM_SRCS = st.integers(min_value=10, max_value=15)
+_NUM_OTHER = st.integers(min_value=3, max_value=8)
+_CITATION_IDS = st.integers(min_value=0, max_value=10_000)
+
+
+# Citation URLs for up to 3 consensus claims x 15 sources, formatted once
+_CONSENSUS_CITATIONS = tuple(
+    tuple(f"https://source{i}_{j}.com" for j in range(15))
+    for i in range(3)
+)
+
+
+@lru_cache(maxsize=None)
+def _cred_high_batch(size: int):
+    """Return a strategy drawing exactly ``size`` high credibility scores."""
+    return st.lists(_CRED_HIGH, min_size=size, max_size=size)
+
+
+@lru_cache(maxsize=None)
+def _entity_names(num_entities: int):
+    """Return the entity names ``Entity_0`` .. ``Entity_{n-1}`` as a tuple."""
+    return tuple(f"Entity_{i}" for i in range(num_entities))
+
+
+@lru_cache(maxsize=None)
+def _index_strategies(num_entities: int):
+    """Return the (source index, target offset) strategies for a list of this size."""
+    return st.integers(0, num_entities - 1), st.integers(1, num_entities - 1)
+
+
+def _draw_endpoints(draw, entities):
+    """
+    Draw two distinct entities by index.
+    
+    The target is offset from the source by 1..n-1 positions (mod n), which
+    avoids building a filtered copy of the entity list for every relationship.
+    """
+    num_entities = len(entities)
+    index_strategy, offset_strategy = _index_strategies(num_entities)
+    source_idx = draw(index_strategy)
+    target_idx = (source_idx + draw(offset_strategy)) % num_entities
+    return entities[source_idx], entities[target_idx]
+
+
+def _relationship(endpoints, relation, citation, credibility):
+    """Construct a Relationship from a drawn (source, target) pair."""
+    source, target = endpoints
+    return Relationship(
+        source=source,
+        relation=relation,
+        target=target,
+        citation=citation,
+        credibility=credibility
+    )
+
+
+def _conflict(contention_id, side_a_credibility, side_b_credibility):
+    """Construct a Conflict whose text fields are keyed by ``contention_id``."""
+    return Conflict(
+        point_of_contention=f"Contention_{contention_id}",
+        side_a=f"Claim A for contention {contention_id}",
+        side_a_citation=f"https://sourcea{contention_id}.com",
+        side_b=f"Claim B for contention {contention_id}",
+        side_b_citation=f"https://sourceb{contention_id}.com",
+        side_a_credibility=side_a_credibility,
+        side_b_credibility=side_b_credibility
+    )
+
+
+@lru_cache(maxsize=None)
+def _relationship_strategy(entities, relations):
+    """Return a strategy for relationships between two distinct ``entities``."""
+    num_entities = len(entities)
+    index_strategy, offset_strategy = _index_strategies(num_entities)
+    endpoints = st.builds(
+        lambda source_idx, offset: (
+            entities[source_idx], entities[(source_idx + offset) % num_entities]
+        ),
+        index_strategy,
+        offset_strategy
+    )
+    return st.builds(
+        _relationship,
+        endpoints,
+        relations,
+        st.builds("https://source{}.com".format, _CITATION_IDS),
+        _CRED_WIDE
+    )
+
+
+# Each contention appears once; the synthesis checks match conflicts by it
+_CONFLICTS = st.lists(
+    st.builds(_conflict, _CITATION_IDS, _CRED_WIDE, _CRED_WIDE),
+    min_size=1,
+    max_size=5,
+    unique_by=lambda conflict: conflict.point_of_contention
+)
+
+
 @st.composite
 def knowledge_graph_with_consensus(draw):
     """
@@ -30,53 +203,51 @@ def knowledge_graph_with_consensus(draw):
     Returns a tuple of (KnowledgeGraph, expected_consensus_count)
     """
     # Generate entities
-    num_entities = draw(st.integers(min_value=5, max_value=15))
-    entities = [f"Entity_{i}" for i in range(num_entities)]
+    entities = _entity_names(draw(_NUM_ENTITIES))
     
     # Generate relationships with some having high agreement
     relationships = []
-    consensus_claims = []
     
     # Create 2-3 consensus claims (same claim from multiple sources)
-    num_consensus = draw(st.integers(min_value=2, max_value=3))
+    num_consensus = draw(_NUM_CONSENSUS)
     
     for i in range(num_consensus):
-        source = draw(st.sampled_from(entities))
-        target = draw(st.sampled_from([e for e in entities if e != source]))
-        relation = draw(st.sampled_from(["supports", "contradicts", "relates_to", "causes"]))
+        source, target = _draw_endpoints(draw, entities)
+        # Relationship holds a single citation, so a consensus claim is one
+        # row per source; the canonical (source, relation, target) key is
+        # built once and shared by all of its rows
+        claim = {"source": source, "relation": draw(_RELATIONS), "target": target}
         
-        # Create multiple relationships for the same claim (consensus)
-        num_sources = draw(st.integers(min_value=10, max_value=15))
-        for j in range(num_sources):
-            rel = Relationship(
-                source=source,
-                relation=relation,
-                target=target,
-                citation=f"https://source{i}_{j}.com",
-                credibility=draw(st.floats(min_value=0.6, max_value=1.0))
+        # Create multiple relationships for the same claim (consensus),
+        # drawing all of their credibilities in one go
+        num_sources = draw(_NUM_SRCS)
+        credibilities = draw(_cred_high_batch(num_sources))
+        relationships.extend(
+            Relationship(
+                **claim,
+                citation=_CONSENSUS_CITATIONS[i][j],
+                credibility=credibility
             )
-            relationships.append(rel)
-        
-        consensus_claims.append((source, relation, target))
+            for j, credibility in enumerate(credibilities)
+        )
     
     # Add some non-consensus relationships
-    num_other = draw(st.integers(min_value=3, max_value=8))
+    num_other = draw(_NUM_OTHER)
     for i in range(num_other):
-        source = draw(st.sampled_from(entities))
-        target = draw(st.sampled_from([e for e in entities if e != source]))
-        relation = draw(st.sampled_from(["supports", "contradicts", "relates_to", "causes"]))
+        source, target = _draw_endpoints(draw, entities)
+        relation = draw(_RELATIONS)
         
         rel = Relationship(
             source=source,
             relation=relation,
             target=target,
             citation=f"https://other{i}.com",
-            credibility=draw(st.floats(min_value=0.3, max_value=0.9))
+            credibility=draw(_CRED_MID)
         )
         relationships.append(rel)
     
     kg = KnowledgeGraph(
-        entities=entities,
+        entities=list(entities),
         relationships=relationships,
         conflicts=[]
     )
@@ -92,49 +263,21 @@ def knowledge_graph_with_conflicts(draw):
     Returns a tuple of (KnowledgeGraph, num_conflicts)
     """
     # Generate entities
-    num_entities = draw(st.integers(min_value=5, max_value=15))
-    entities = [f"Entity_{i}" for i in range(num_entities)]
-    
-    # Generate conflicts
-    num_conflicts = draw(st.integers(min_value=1, max_value=5))
-    conflicts = []
-    
-    for i in range(num_conflicts):
-        conflict = Conflict(
-            point_of_contention=f"Contention_{i}",
-            side_a=f"Claim A for contention {i}",
-            side_a_citation=f"https://sourcea{i}.com",
-            side_b=f"Claim B for contention {i}",
-            side_b_citation=f"https://sourceb{i}.com",
-            side_a_credibility=draw(st.floats(min_value=0.3, max_value=1.0)),
-            side_b_credibility=draw(st.floats(min_value=0.3, max_value=1.0))
-        )
-        conflicts.append(conflict)
+    entities = _entity_names(draw(_NUM_ENTITIES))
     
-    # Generate some relationships
-    relationships = []
-    num_rels = draw(st.integers(min_value=3, max_value=10))
-    for i in range(num_rels):
-        source = draw(st.sampled_from(entities))
-        target = draw(st.sampled_from([e for e in entities if e != source]))
-        relation = draw(st.sampled_from(["supports", "contradicts", "relates_to"]))
-        
-        rel = Relationship(
-            source=source,
-            relation=relation,
-            target=target,
-            citation=f"https://source{i}.com",
-            credibility=draw(st.floats(min_value=0.3, max_value=1.0))
-        )
-        relationships.append(rel)
+    # Generate conflicts and some relationships
+    conflicts = draw(_CONFLICTS)
+    relationships = draw(st.lists(
+        _relationship_strategy(entities, _RELATIONS3), min_size=3, max_size=10
+    ))
     
     kg = KnowledgeGraph(
-        entities=entities,
+        entities=list(entities),
         relationships=relationships,
         conflicts=conflicts
     )
     
-    return kg, num_conflicts
+    return kg, len(conflicts)
 
 
 @st.composite
@@ -143,43 +286,16 @@ def complete_knowledge_graph(draw):
     Generate a complete knowledge graph with entities, relationships, and conflicts.
     """
     # Generate entities
-    num_entities = draw(st.integers(min_value=5, max_value=15))
-    entities = [f"Entity_{i}" for i in range(num_entities)]
+    entities = _entity_names(draw(_NUM_ENTITIES))
     
-    # Generate relationships
-    relationships = []
-    num_rels = draw(st.integers(min_value=5, max_value=20))
-    for i in range(num_rels):
-        source = draw(st.sampled_from(entities))
-        target = draw(st.sampled_from([e for e in entities if e != source]))
-        relation = draw(st.sampled_from(["supports", "contradicts", "relates_to", "causes"]))
-        
-        rel = Relationship(
-            source=source,
-            relation=relation,
-            target=target,
-            citation=f"https://source{i}.com",
-            credibility=draw(st.floats(min_value=0.3, max_value=1.0))
-        )
-        relationships.append(rel)
-    
-    # Generate conflicts
-    num_conflicts = draw(st.integers(min_value=1, max_value=5))
-    conflicts = []
-    for i in range(num_conflicts):
-        conflict = Conflict(
-            point_of_contention=f"Contention_{i}",
-            side_a=f"Claim A for contention {i}",
-            side_a_citation=f"https://sourcea{i}.com",
-            side_b=f"Claim B for contention {i}",
-            side_b_citation=f"https://sourceb{i}.com",
-            side_a_credibility=draw(st.floats(min_value=0.3, max_value=1.0)),
-            side_b_credibility=draw(st.floats(min_value=0.3, max_value=1.0))
-        )
-        conflicts.append(conflict)
+    # Generate relationships and conflicts
+    relationships = draw(st.lists(
+        _relationship_strategy(entities, _RELATIONS), min_size=5, max_size=20
+    ))
+    conflicts = draw(_CONFLICTS)
     
     kg = KnowledgeGraph(
-        entities=entities,
+        entities=list(entities),
         relationships=relationships,
         conflicts=conflicts
     )
@@ -188,7 +304,6 @@ def complete_knowledge_graph(draw):
 
 
 # Property 19: Consensus identification
-@settings(max_examples=100)
 @given(kg_data=knowledge_graph_with_consensus())
 def test_property_19_consensus_identification(kg_data):
     """
@@ -201,11 +316,8 @@ def test_property_19_consensus_identification(kg_data):
     """
     kg, expected_min_consensus = kg_data
     
-    # Create synthesis agent with mock LLM (we don't need LLM for consensus identification)
-    class MockLLM:
-        pass
-    
-    agent = SynthesisAgent(consensus_threshold=0.9, llm=MockLLM())
+    # Synthesis agent with mock LLM (we don't need LLM for consensus identification)
+    agent = _agent(consensus_threshold=0.9)
     
     # Identify consensus points
     consensus_points = agent.identify_consensus(kg)
@@ -222,7 +334,6 @@ def test_property_19_consensus_identification(kg_data):
 
 
 # Property 20: Battleground extraction
-@settings(max_examples=100)
 @given(kg_data=knowledge_graph_with_conflicts())
 def test_property_20_battleground_extraction(kg_data):
     """
@@ -235,11 +346,8 @@ def test_property_20_battleground_extraction(kg_data):
     """
     kg, num_conflicts = kg_data
     
-    # Create synthesis agent with mock LLM
-    class MockLLM:
-        pass
-    
-    agent = SynthesisAgent(llm=MockLLM())
+    # Synthesis agent with mock LLM
+    agent = _agent()
     
     # Extract battleground topics
     battleground_topics = agent.extract_battleground_topics(kg)
@@ -251,26 +359,26 @@ def test_property_20_battleground_extraction(kg_data):
     
     # Verify each battleground topic has required fields
     for bt in battleground_topics:
-        assert hasattr(bt, 'topic'), "Battleground topic should have 'topic' field"
-        assert hasattr(bt, 'conflicting_claims'), "Battleground topic should have 'conflicting_claims' field"
-        assert hasattr(bt, 'disagreement_reason'), "Battleground topic should have 'disagreement_reason' field"
-        assert hasattr(bt, 'verdict'), "Battleground topic should have 'verdict' field"
-        assert hasattr(bt, 'verdict_confidence'), "Battleground topic should have 'verdict_confidence' field"
-        assert hasattr(bt, 'supporting_evidence'), "Battleground topic should have 'supporting_evidence' field"
+        try:
+            topic, claims, reason, verdict, vconf, evidence = (
+                bt.topic, bt.conflicting_claims, bt.disagreement_reason,
+                bt.verdict, bt.verdict_confidence, bt.supporting_evidence
+            )
+        except AttributeError as e:
+            pytest.fail(f"Battleground topic is missing a required field: {e}")
         
         # Verify fields are non-empty
-        assert bt.topic, "Topic should be non-empty"
-        assert len(bt.conflicting_claims) >= 2, "Should have at least 2 conflicting claims"
-        assert bt.disagreement_reason, "Disagreement reason should be non-empty"
-        assert bt.verdict, "Verdict should be non-empty"
-        assert 0.0 <= bt.verdict_confidence <= 1.0, "Verdict confidence should be between 0 and 1"
-        assert len(bt.supporting_evidence) > 0, "Should have supporting evidence"
+        assert topic, "Topic should be non-empty"
+        assert len(claims) >= 2, "Should have at least 2 conflicting claims"
+        assert reason, "Disagreement reason should be non-empty"
+        assert verdict, "Verdict should be non-empty"
+        assert 0.0 <= vconf <= 1.0, "Verdict confidence should be between 0 and 1"
+        assert len(evidence) > 0, "Should have supporting evidence"
 
 
 # Property 21: Report structure completeness
-@settings(max_examples=100)
 @given(
-    topic=st.text(min_size=5, max_size=100, alphabet=st.characters(whitelist_categories=('L', 'N'))),
+    topic=_TOPICS,
     kg=complete_knowledge_graph()
 )
 def test_property_21_report_structure_completeness(topic, kg):
@@ -282,32 +390,8 @@ def test_property_21_report_structure_completeness(topic, kg):
     
     Validates: Requirements 7.5, 7.6
     """
-    assume(topic.strip())  # Ensure topic is not just whitespace
-    
-    # Create synthesis agent (mock LLM to avoid API calls)
-    class MockLLM:
-        def invoke(self, messages):
-            class MockResponse:
-                content = """# The Consensus
-
-Based on the analysis of sources, the following points show strong agreement:
-- Key finding 1
-- Key finding 2
-
-# The Battleground
-
-The following topics show significant disagreement:
-- Conflict 1: Different perspectives exist
-- Conflict 2: Sources disagree on methodology
-
-# The Verdict
-
-Based on credibility analysis:
-- For Conflict 1: Side A is more likely correct
-- For Conflict 2: Insufficient evidence to determine"""
-            return MockResponse()
-    
-    agent = SynthesisAgent(llm=MockLLM())
+    # Synthesis agent (mock LLM to avoid API calls)
+    agent = _agent(_REPORT_MOCK_LLM)
     
     # Create final report
     report = agent.create_final_report(topic, kg)
@@ -316,61 +400,67 @@ Based on credibility analysis:
     assert isinstance(report, str), "Report should be a string"
     assert len(report) > 0, "Report should not be empty"
     
-    # Check for required sections
-    report_lower = report.lower()
-    
-    # Should contain consensus section
-    assert "consensus" in report_lower, "Report should contain 'Consensus' section"
-    
-    # Should contain battleground section
-    assert "battleground" in report_lower, "Report should contain 'Battleground' section"
-    
-    # Should contain verdict section
-    assert "verdict" in report_lower, "Report should contain 'Verdict' section"
-    
-    # Should contain knowledge graph JSON
-    assert "knowledge graph" in report_lower, "Report should reference 'Knowledge Graph'"
-    assert "json" in report_lower, "Report should contain JSON"
+    # Check for required sections: Consensus, Battleground, Verdict and the
+    # Knowledge Graph JSON, in report order
+    assert _REPORT_SECTIONS.search(report.lower()), (
+        "Report should contain Consensus, Battleground, Verdict and Knowledge Graph JSON sections"
+    )
     
     # Verify JSON is parseable
-    # Extract JSON from code block
-    if "```json" in report:
-        json_start = report.find("```json") + 7
-        json_end = report.find("```", json_start)
-        json_str = report[json_start:json_end].strip()
-        
-        # Parse JSON to verify it's valid
-        graph_data = json.loads(json_str)
-        
-        # Verify JSON structure
-        assert "entities" in graph_data, "JSON should contain 'entities'"
-        assert "relationships" in graph_data, "JSON should contain 'relationships'"
-        assert "conflicts" in graph_data, "JSON should contain 'conflicts'"
-        
-        # Verify data matches knowledge graph
-        assert len(graph_data["entities"]) == len(kg.entities), \
-            "JSON entities count should match knowledge graph"
-        assert len(graph_data["relationships"]) == len(kg.relationships), \
-            "JSON relationships count should match knowledge graph"
-        assert len(graph_data["conflicts"]) == len(kg.conflicts), \
-            "JSON conflicts count should match knowledge graph"
+    # create_final_report always appends the graph in a ```json fence, so
+    # locate it with a single scan and require it to be present
+    json_start = report.find("```json")
+    assert json_start != -1, "Report should contain a JSON code block"
+    json_start += len("```json")
+    json_end = report.find("```", json_start)
+    json_str = report[json_start:json_end].strip()
+    
+    # Parse JSON to verify it's valid
+    graph_data = json.loads(json_str)
+    
+    # Verify JSON structure and that its counts match the knowledge graph
+    # (a missing key surfaces as a KeyError naming it)
+    expected = {
+        "entities": len(kg.entities),
+        "relationships": len(kg.relationships),
+        "conflicts": len(kg.conflicts),
+    }
+    assert {k: len(graph_data[k]) for k in expected} == expected, \
+        "JSON counts should match knowledge graph"
 
 
-# Additional unit tests for specific functionality
-def test_serialize_knowledge_graph():
-    """Test that knowledge graph serialization produces valid JSON."""
-    # Create a simple knowledge graph
-    kg = KnowledgeGraph(
+# Knowledge graphs for the unit tests below; the tests only read them
+_SIMPLE_RELATIONSHIP = Relationship(
+    source="Entity1",
+    relation="supports",
+    target="Entity2",
+    citation="https://source1.com",
+    credibility=0.8
+)
+
+
+@pytest.fixture(scope="module")
+def empty_kg():
+    """Knowledge graph with a single entity and nothing else."""
+    return KnowledgeGraph(entities=["Entity1"], relationships=[], conflicts=[])
+
+
+@pytest.fixture(scope="module")
+def no_conflict_kg():
+    """Knowledge graph with one relationship and no conflicts."""
+    return KnowledgeGraph(
+        entities=["Entity1", "Entity2"],
+        relationships=[_SIMPLE_RELATIONSHIP],
+        conflicts=[]
+    )
+
+
+@pytest.fixture(scope="module")
+def simple_full_kg():
+    """Knowledge graph with three entities, one relationship and one conflict."""
+    return KnowledgeGraph(
         entities=["Entity1", "Entity2", "Entity3"],
-        relationships=[
-            Relationship(
-                source="Entity1",
-                relation="supports",
-                target="Entity2",
-                citation="https://source1.com",
-                credibility=0.8
-            )
-        ],
+        relationships=[_SIMPLE_RELATIONSHIP],
         conflicts=[
             Conflict(
                 point_of_contention="Test conflict",
@@ -383,13 +473,14 @@ def test_serialize_knowledge_graph():
             )
         ]
     )
-    
-    # Create agent with mock LLM
-    class MockLLM:
-        pass
-    
-    agent = SynthesisAgent(llm=MockLLM())
-    json_str = agent.serialize_knowledge_graph(kg)
+
+
+# Additional unit tests for specific functionality
+def test_serialize_knowledge_graph(simple_full_kg):
+    """Test that knowledge graph serialization produces valid JSON."""
+    # Agent with mock LLM
+    agent = _agent()
+    json_str = agent.serialize_knowledge_graph(simple_full_kg)
     
     # Verify it's valid JSON
     graph_data = json.loads(json_str)
@@ -405,43 +496,21 @@ def test_serialize_knowledge_graph():
     assert len(graph_data["conflicts"]) == 1
 
 
-def test_consensus_with_no_relationships():
+def test_consensus_with_no_relationships(empty_kg):
     """Test consensus identification with empty knowledge graph."""
-    kg = KnowledgeGraph(entities=["Entity1"], relationships=[], conflicts=[])
-    
-    # Create agent with mock LLM
-    class MockLLM:
-        pass
-    
-    agent = SynthesisAgent(llm=MockLLM())
-    consensus_points = agent.identify_consensus(kg)
+    # Agent with mock LLM
+    agent = _agent()
+    consensus_points = agent.identify_consensus(empty_kg)
     
     # Should return empty list
     assert consensus_points == []
 
 
-def test_battleground_with_no_conflicts():
+def test_battleground_with_no_conflicts(no_conflict_kg):
     """Test battleground extraction with no conflicts."""
-    kg = KnowledgeGraph(
-        entities=["Entity1", "Entity2"],
-        relationships=[
-            Relationship(
-                source="Entity1",
-                relation="supports",
-                target="Entity2",
-                citation="https://source1.com",
-                credibility=0.8
-            )
-        ],
-        conflicts=[]
-    )
-    
-    # Create agent with mock LLM
-    class MockLLM:
-        pass
-    
-    agent = SynthesisAgent(llm=MockLLM())
-    battleground_topics = agent.extract_battleground_topics(kg)
+    # Agent with mock LLM
+    agent = _agent()
+    battleground_topics = agent.extract_battleground_topics(no_conflict_kg)
     
     # Should return empty list
     assert battleground_topics == []
@@ -6,19 +6,41 @@ for workflow initialization and execution.
 """
 
 import pytest
-from hypothesis import given, strategies as st, assume, settings
-from unittest.mock import Mock
+from hypothesis import given, strategies as st, settings
+from unittest.mock import Mock, patch
 from agents.workflow import WorkflowOrchestrator
-from agents.scout import ScoutAgent
-from agents.mapper import MapperAgent
-from agents.adversary import AdversaryAgent
 from models.data_models import WorkflowState
 
 
+# Valid topics by construction: optional surrounding whitespace and at least one
+# Unicode letter or digit ([^\W_] matches exactly what str.isalnum() accepts)
+_VALID_TOPIC_PATTERN = r"\s{0,3}[^\W_][\w\s\-.,?()]{0,100}"
+
+
+@pytest.fixture(scope="module")
+def mock_agents():
+    """Build the five mock agents once; the tests never call into them."""
+    return {
+        "scout_agent": Mock(),
+        "mapper_agent": Mock(),
+        "adversary_agent": Mock(),
+        "judge_agent": Mock(),
+        "synthesis_agent": Mock(),
+    }
+
+
+@pytest.fixture(scope="module")
+def make_orchestrator(mock_agents):
+    """Return a factory for orchestrators wired to the shared mock agents."""
+    return lambda max_iterations=3: WorkflowOrchestrator(
+        max_iterations=max_iterations, **mock_agents
+    )
+
+
 # Property 1: Workflow initialization with valid topics
-@given(st.text(min_size=1, max_size=500))
+@given(st.from_regex(_VALID_TOPIC_PATTERN, fullmatch=True))
 @settings(deadline=None)
-def test_property_1_workflow_initialization_valid_topics(topic: str):
+def test_property_1_workflow_initialization_valid_topics(make_orchestrator, topic: str):
     """
     Feature: adversarial-knowledge-cartographer, Property 1: 
     Workflow initialization with valid topics
@@ -29,24 +51,8 @@ def test_property_1_workflow_initialization_valid_topics(topic: str):
     
     Validates: Requirements 1.1, 1.3, 1.4
     """
-    # Assume topic has meaningful content (at least one alphanumeric character)
-    assume(any(c.isalnum() for c in topic))
-    assume(topic.strip())  # Not just whitespace
-    
     # Create orchestrator with mock agents
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(
-        max_iterations=3,
-        scout_agent=mock_scout,
-        mapper_agent=mock_mapper,
-        adversary_agent=mock_adversary,
-        judge_agent=mock_judge,
-        synthesis_agent=mock_synthesis
-    )
+    orchestrator = make_orchestrator(3)
     state = orchestrator.initialize(topic)
     
     # Verify state is properly initialized
@@ -68,7 +74,7 @@ def test_property_1_workflow_initialization_valid_topics(topic: str):
     )
 )
 @settings(deadline=None)
-def test_property_2_invalid_topic_rejection(topic: str):
+def test_property_2_invalid_topic_rejection(make_orchestrator, topic: str):
     """
     Feature: adversarial-knowledge-cartographer, Property 2: 
     Invalid topic rejection
@@ -80,19 +86,7 @@ def test_property_2_invalid_topic_rejection(topic: str):
     Validates: Requirements 1.2
     """
     # Create orchestrator with mock agents
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(
-        max_iterations=3,
-        scout_agent=mock_scout,
-        mapper_agent=mock_mapper,
-        adversary_agent=mock_adversary,
-        judge_agent=mock_judge,
-        synthesis_agent=mock_synthesis
-    )
+    orchestrator = make_orchestrator(3)
     
     # Should raise ValueError for invalid topics
     with pytest.raises(ValueError) as exc_info:
@@ -103,65 +97,40 @@ def test_property_2_invalid_topic_rejection(topic: str):
 
 
 # Additional edge case tests for topic validation
-def test_empty_string_topic():
+def test_empty_string_topic(make_orchestrator):
     """Test that empty string is rejected."""
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(scout_agent=mock_scout, mapper_agent=mock_mapper, adversary_agent=mock_adversary, judge_agent=mock_judge, synthesis_agent=mock_synthesis)
+    orchestrator = make_orchestrator()
     with pytest.raises(ValueError):
         orchestrator.initialize("")
 
 
-def test_whitespace_only_topic():
+@pytest.mark.parametrize("whitespace", ["   ", "\t", "\n", " \t\n "])
+def test_whitespace_only_topic(whitespace, make_orchestrator):
     """Test that whitespace-only strings are rejected."""
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(scout_agent=mock_scout, mapper_agent=mock_mapper, adversary_agent=mock_adversary, judge_agent=mock_judge, synthesis_agent=mock_synthesis)
-    for whitespace in ["   ", "\t", "\n", " \t\n "]:
-        with pytest.raises(ValueError):
-            orchestrator.initialize(whitespace)
-
-
-def test_special_characters_only_topic():
+    orchestrator = make_orchestrator()
+    with pytest.raises(ValueError):
+        orchestrator.initialize(whitespace)
+
+
+@pytest.mark.parametrize("special", ["!!!", "...", "---", "###", "***"])
+def test_special_characters_only_topic(special, make_orchestrator):
     """Test that strings with only special characters are rejected."""
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(scout_agent=mock_scout, mapper_agent=mock_mapper, adversary_agent=mock_adversary, judge_agent=mock_judge, synthesis_agent=mock_synthesis)
-    for special in ["!!!", "...", "---", "###", "***"]:
-        with pytest.raises(ValueError):
-            orchestrator.initialize(special)
-
-
-def test_valid_topic_with_leading_trailing_whitespace():
+    orchestrator = make_orchestrator()
+    with pytest.raises(ValueError):
+        orchestrator.initialize(special)
+
+
+def test_valid_topic_with_leading_trailing_whitespace(make_orchestrator):
     """Test that valid topics with whitespace are trimmed."""
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(scout_agent=mock_scout, mapper_agent=mock_mapper, adversary_agent=mock_adversary, judge_agent=mock_judge, synthesis_agent=mock_synthesis)
+    orchestrator = make_orchestrator()
     state = orchestrator.initialize("  valid topic  ")
     assert state.topic == "valid topic"
     assert state.status_message is not None
 
 
-def test_valid_topic_with_mixed_content():
+def test_valid_topic_with_mixed_content(make_orchestrator):
     """Test that topics with alphanumeric and special characters work."""
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(scout_agent=mock_scout, mapper_agent=mock_mapper, adversary_agent=mock_adversary, judge_agent=mock_judge, synthesis_agent=mock_synthesis)
+    orchestrator = make_orchestrator()
     topics = [
         "AI safety",
         "climate-change",
@@ -180,7 +149,7 @@ def test_valid_topic_with_mixed_content():
 # Property 17: Maximum iteration limit
 @given(st.integers(min_value=1, max_value=10))
 @settings(deadline=None)
-def test_property_17_maximum_iteration_limit(max_iterations: int):
+def test_property_17_maximum_iteration_limit(make_orchestrator, max_iterations: int):
     """
     Feature: adversarial-knowledge-cartographer, Property 17: 
     Maximum iteration limit
@@ -191,19 +160,7 @@ def test_property_17_maximum_iteration_limit(max_iterations: int):
     Validates: Requirements 6.4
     """
     # Create orchestrator with mock agents
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(
-        max_iterations=max_iterations,
-        scout_agent=mock_scout,
-        mapper_agent=mock_mapper,
-        adversary_agent=mock_adversary,
-        judge_agent=mock_judge,
-        synthesis_agent=mock_synthesis
-    )
+    orchestrator = make_orchestrator(max_iterations)
     
     # Create a state that simulates being at the iteration limit
     state = WorkflowState(
@@ -232,14 +189,9 @@ def test_property_17_maximum_iteration_limit(max_iterations: int):
         assert decision_before == "continue", f"Expected 'continue' before max iterations, got '{decision_before}'"
 
 
-def test_iteration_limit_with_no_weak_claims():
+def test_iteration_limit_with_no_weak_claims(make_orchestrator):
     """Test that workflow proceeds when no weak claims are found, regardless of iteration count."""
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(max_iterations=3, scout_agent=mock_scout, mapper_agent=mock_mapper, adversary_agent=mock_adversary, judge_agent=mock_judge, synthesis_agent=mock_synthesis)
+    orchestrator = make_orchestrator(3)
     
     # State with no adversarial queries (no weak claims)
     state = WorkflowState(
@@ -254,14 +206,9 @@ def test_iteration_limit_with_no_weak_claims():
     assert decision == "proceed", "Should proceed when no weak claims found"
 
 
-def test_iteration_limit_at_zero():
+def test_iteration_limit_at_zero(make_orchestrator):
     """Test that iteration 0 with weak claims continues."""
-    mock_scout = Mock(spec=ScoutAgent)
-    mock_mapper = Mock(spec=MapperAgent)
-    mock_adversary = Mock(spec=AdversaryAgent)
-    mock_judge = Mock()
-    mock_synthesis = Mock()
-    orchestrator = WorkflowOrchestrator(max_iterations=3, scout_agent=mock_scout, mapper_agent=mock_mapper, adversary_agent=mock_adversary, judge_agent=mock_judge, synthesis_agent=mock_synthesis)
+    orchestrator = make_orchestrator(3)
     
     state = WorkflowState(
         topic="test topic",
@@ -275,23 +222,36 @@ def test_iteration_limit_at_zero():
     assert decision == "continue", "Should continue at iteration 0 with weak claims"
 
 
-def test_iteration_exactly_at_limit():
+@pytest.mark.parametrize("max_iter", [1, 2, 3, 5, 10])
+def test_iteration_exactly_at_limit(max_iter, make_orchestrator):
     """Test that reaching exactly the max iteration limit triggers proceed."""
-    for max_iter in [1, 2, 3, 5, 10]:
-        mock_scout = Mock(spec=ScoutAgent)
-        mock_mapper = Mock(spec=MapperAgent)
-        mock_adversary = Mock(spec=AdversaryAgent)
-        mock_judge = Mock()
-        mock_synthesis = Mock()
-        orchestrator = WorkflowOrchestrator(max_iterations=max_iter, scout_agent=mock_scout, mapper_agent=mock_mapper, adversary_agent=mock_adversary, judge_agent=mock_judge, synthesis_agent=mock_synthesis)
-        
-        state = WorkflowState(
-            topic="test topic",
-            iteration=max_iter,
-            max_iterations=max_iter,
-            current_phase="adversary",
-            adversarial_queries=["query1", "query2"]  # Weak claims present
-        )
-        
-        decision = orchestrator._should_continue_iteration(state)
-        assert decision == "proceed", f"Should proceed at max_iterations={max_iter}"
+    orchestrator = make_orchestrator(max_iter)
+    
+    state = WorkflowState(
+        topic="test topic",
+        iteration=max_iter,
+        max_iterations=max_iter,
+        current_phase="adversary",
+        adversarial_queries=["query1", "query2"]  # Weak claims present
+    )
+    
+    decision = orchestrator._should_continue_iteration(state)
+    assert decision == "proceed", f"Should proceed at max_iterations={max_iter}"
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_execute_closes_checkpoint_writer(mock_agents, tmp_path, fails):
+    """Test that execute waits for queued checkpoint writes on success and failure."""
+    orchestrator = WorkflowOrchestrator(checkpoint_dir=str(tmp_path), **mock_agents)
+    orchestrator.graph = Mock()
+    if fails:
+        orchestrator.graph.invoke.side_effect = RuntimeError("graph failed")
+    
+    with patch.object(orchestrator.checkpoint_manager, "close") as mock_close:
+        if fails:
+            with pytest.raises(RuntimeError, match="graph failed"):
+                orchestrator.execute("test topic")
+        else:
+            orchestrator.execute("test topic")
+    
+    mock_close.assert_called_once_with()
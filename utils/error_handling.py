@@ -5,11 +5,22 @@ This module provides comprehensive error handling including exponential backoff,
 graceful degradation, and state recovery mechanisms.
 """
 
+import asyncio
+import inspect
 import logging
+import os
+import re
+import sys
+import tempfile
+import threading
 import time
+import gzip
 import json
 import pickle
+import random
 from typing import Optional, Callable, Any, TypeVar
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from functools import wraps
 from pathlib import Path
 
@@ -17,6 +28,31 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Dedicated generator for retry jitter, kept apart from the global random state
+_jitter_rng = random.Random()
+
+# Error classification patterns, compiled once and matched case-insensitively
+_RATE_LIMIT_RE = re.compile(r"rate[ _]limit|429|too many requests|quota exceeded", re.IGNORECASE)
+_TIMEOUT_RE = re.compile(r"timeout|timed out", re.IGNORECASE)
+_SERVER_ERROR_RE = re.compile(r"50[023]")
+_AUTH_ERROR_RE = re.compile(r"auth|40[13]", re.IGNORECASE)
+_CLIENT_ERROR_RE = re.compile(r"40[04]")
+
+# Provider SDK exception types, as (module, attribute). They are only looked up
+# in modules that are already imported: an exception cannot come from an SDK
+# that was never loaded, and importing one here would slow startup
+_RATE_LIMIT_EXC_TYPES = (
+    ("openai", "RateLimitError"),
+    ("anthropic", "RateLimitError"),
+    ("groq", "RateLimitError"),
+)
+_TIMEOUT_EXC_TYPES = (
+    ("openai", "APITimeoutError"),
+    ("anthropic", "APITimeoutError"),
+    ("groq", "APITimeoutError"),
+    ("httpx", "TimeoutException"),
+)
+
 
 class RetryableError(Exception):
     """Exception that indicates an operation should be retried."""
@@ -33,71 +69,400 @@ class StateRecoveryError(Exception):
     pass
 
 
+class CircuitOpenError(NonRetryableError):
+    """Exception raised when a call is rejected by an open circuit breaker."""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that stops calling an operation which keeps failing.
+    
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected until ``recovery_time`` seconds have passed. One trial
+    call is then let through (half-open): success closes the circuit again,
+    failure re-opens it for another ``recovery_time``. A trial that ends
+    without a verdict is released with ``release_trial``; one that never
+    reports back is abandoned after ``recovery_time``.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_time: Seconds to reject calls before allowing a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        with self._lock:
+            return self._rejecting()
+    
+    def _rejecting(self) -> bool:
+        """Check the open state; the caller must hold the lock."""
+        return (
+            self.state == self.OPEN
+            and time.monotonic() - self._opened_at < self.recovery_time
+        )
+    
+    def allow(self) -> bool:
+        """
+        Check whether a call may proceed, moving to half-open once recovered.
+        
+        Returns:
+            True if the call may proceed, False if it should be rejected
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if (
+                (self.state == self.OPEN and not self._rejecting())
+                or (self.state == self.HALF_OPEN
+                    and now - self._trial_started >= self.recovery_time)
+            ):
+                # Let exactly one trial call through
+                self.state = self.HALF_OPEN
+                self._trial_started = now
+                return True
+            return False
+    
+    def release_trial(self) -> None:
+        """
+        Give up a half-open trial call that ended without success or failure.
+        
+        The circuit returns to its expired open state, so the next call
+        becomes the trial. Does nothing unless a trial is in progress.
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+    
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+    
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        f"Circuit breaker opened after {self._failures} consecutive failures"
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """
+    Describes how a Retry decorator retries a failing call.
+    
+    Delays grow exponentially from ``initial_backoff`` by ``backoff_factor``
+    per attempt and are capped at ``max_backoff``.
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        backoff_factor: float = 2.0,
+        jitter: bool = True,
+        should_retry: Optional[Callable[[Exception], bool]] = None,
+        failure_threshold: Optional[int] = None,
+        recovery_time: float = 30.0,
+        total_deadline: Optional[float] = None
+    ):
+        """
+        Initialize retry policy.
+        
+        Args:
+            max_attempts: Total number of attempts, including the first call
+            initial_backoff: Delay before the first retry in seconds
+            max_backoff: Maximum delay before any retry in seconds
+            backoff_factor: Multiplier for the delay on each retry
+            jitter: Whether to use "full jitter", sleeping a uniformly random
+                time between zero and the capped exponential backoff
+            should_retry: Predicate selecting which errors are retried; all
+                errors except NonRetryableError are retried by default
+            failure_threshold: Consecutive failures that open a per-function
+                circuit breaker, or None for no circuit breaker
+            recovery_time: Seconds an open circuit rejects calls
+            total_deadline: Retry budget in seconds per call; a retry whose
+                delay would end past the budget is not attempted and the last
+                error is raised instead. None for no budget
+        """
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.should_retry = should_retry
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.total_deadline = total_deadline
+    
+    @classmethod
+    def rate_limit_only(
+        cls,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0
+    ) -> "RetryPolicy":
+        """
+        Policy that retries only rate limit errors, doubling the delay each time.
+        
+        Args:
+            max_retries: Maximum number of retries after the first call
+            base_delay: Delay cap before the first retry in seconds
+            max_delay: Maximum delay before any retry in seconds
+            
+        Returns:
+            RetryPolicy for rate limited API calls
+        """
+        return cls(
+            max_attempts=max_retries + 1,
+            initial_backoff=base_delay,
+            max_backoff=max_delay,
+            backoff_factor=2.0,
+            should_retry=is_rate_limit_error
+        )
+    
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the delay before retrying after a failed attempt.
+        
+        Args:
+            attempt: Zero-based index of the attempt that failed
+            
+        Returns:
+            Delay in seconds
+        """
+        # Full jitter spreads concurrent clients' retries across the whole window
+        capped_backoff = min(self.initial_backoff * self.backoff_factor ** attempt, self.max_backoff)
+        if self.jitter:
+            return _jitter_rng.uniform(0, capped_backoff)
+        return capped_backoff
+
+
+class Retry:
+    """
+    Decorator retrying a function according to a RetryPolicy.
+    
+    Works for both plain functions and ``async def`` coroutine functions; the
+    latter wait with ``asyncio.sleep`` so the event loop is never blocked.
+    Each decorated function gets its own circuit breaker (if the policy
+    enables one) unless a shared breaker is passed in, exposed as the
+    wrapper's ``circuit_breaker`` attribute.
+    """
+    
+    def __init__(self, policy: RetryPolicy, breaker: Optional[CircuitBreaker] = None):
+        """
+        Initialize retry decorator.
+        
+        Args:
+            policy: Retry policy to apply
+            breaker: Circuit breaker shared by every function this decorates,
+                e.g. one per upstream provider. Overrides the policy's
+                per-function breaker
+        """
+        self.policy = policy
+        self.breaker = breaker
+    
+    def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
+        policy = self.policy
+        breaker = self.breaker
+        if breaker is None and policy.failure_threshold is not None:
+            breaker = CircuitBreaker(policy.failure_threshold, policy.recovery_time)
+        # At least one attempt is always made
+        attempts = range(max(1, policy.max_attempts))
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                start = time.monotonic()
+                for attempt in attempts:
+                    self._check_circuit(func, breaker)
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception as e:
+                        delay = self._on_failure(func, attempt, e, breaker, start)
+                        if delay is None:
+                            raise
+                        await asyncio.sleep(delay)
+                    except BaseException:
+                        # Cancelled or interrupted: no verdict on the service
+                        if breaker is not None:
+                            breaker.release_trial()
+                        raise
+                    else:
+                        if breaker is not None:
+                            breaker.record_success()
+                        return result
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.monotonic()
+                for attempt in attempts:
+                    self._check_circuit(func, breaker)
+                    try:
+                        result = func(*args, **kwargs)
+                    except Exception as e:
+                        delay = self._on_failure(func, attempt, e, breaker, start)
+                        if delay is None:
+                            raise
+                        time.sleep(delay)
+                    except BaseException:
+                        # Interrupted: no verdict on the service
+                        if breaker is not None:
+                            breaker.release_trial()
+                        raise
+                    else:
+                        if breaker is not None:
+                            breaker.record_success()
+                        return result
+        
+        wrapper.circuit_breaker = breaker
+        return wrapper
+    
+    @staticmethod
+    def _check_circuit(func: Callable, breaker: Optional[CircuitBreaker]) -> None:
+        """Raise CircuitOpenError if the breaker is rejecting calls."""
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {func.__name__}; rejecting call")
+    
+    def _on_failure(
+        self,
+        func: Callable,
+        attempt: int,
+        error: Exception,
+        breaker: Optional[CircuitBreaker],
+        start: float
+    ) -> Optional[float]:
+        """
+        Record a failed attempt and decide whether to retry it.
+        
+        Args:
+            func: Decorated function
+            attempt: Zero-based index of the failed attempt
+            error: Exception raised by the attempt
+            breaker: Circuit breaker for the function, if any
+            start: time.monotonic() when the call began
+            
+        Returns:
+            Delay before the next attempt in seconds, or None to re-raise
+        """
+        policy = self.policy
+        
+        # Don't retry non-retryable errors. They are the caller's fault (bad
+        # request, auth) rather than the service's, so they don't count
+        # towards opening the circuit either
+        if isinstance(error, NonRetryableError):
+            if breaker is not None:
+                breaker.release_trial()
+            return None
+        
+        if breaker is not None:
+            breaker.record_failure()
+        if policy.should_retry is not None and not policy.should_retry(error):
+            return None
+        
+        if attempt >= policy.max_attempts - 1:
+            # Last attempt failed
+            logger.error(
+                f"Function {func.__name__} failed after {policy.max_attempts} attempts: {error}"
+            )
+            return None
+        
+        if breaker is not None and breaker.is_open:
+            # No point sleeping before a call the breaker will reject
+            logger.error(
+                f"Function {func.__name__} failed and its circuit is open: {error}"
+            )
+            return None
+        
+        delay = policy.backoff(attempt)
+        if policy.total_deadline is not None:
+            elapsed = time.monotonic() - start
+            if elapsed + delay > policy.total_deadline:
+                logger.error(
+                    f"Function {func.__name__} failed and its retry budget of "
+                    f"{policy.total_deadline:.2f}s is exhausted: {error}"
+                )
+                return None
+        
+        logger.warning(
+            f"Function {func.__name__} failed (attempt {attempt + 1}/{policy.max_attempts}): {error}. "
+            f"Retrying in {delay:.2f}s"
+        )
+        return delay
+
+
 def exponential_backoff_retry(
     max_retries: int = 3,
     initial_backoff: float = 1.0,
     max_backoff: float = 60.0,
     backoff_factor: float = 2.0,
-    jitter: bool = True
+    jitter: bool = True,
+    failure_threshold: Optional[int] = None,
+    recovery_time: float = 30.0,
+    total_deadline: Optional[float] = None
 ):
     """
     Decorator for retrying functions with exponential backoff.
     
+    If ``failure_threshold`` is set, each decorated function gets its own
+    circuit breaker, shared by all of its calls: once that many attempts in a
+    row have failed, further calls fail fast with CircuitOpenError until
+    ``recovery_time`` has passed. NonRetryableError does not count as a
+    failure. The breaker is exposed as the wrapper's ``circuit_breaker``
+    attribute (None when disabled).
+    
     Args:
         max_retries: Maximum number of retry attempts
         initial_backoff: Initial backoff time in seconds
         max_backoff: Maximum backoff time in seconds
         backoff_factor: Multiplier for backoff time on each retry
-        jitter: Whether to add random jitter to backoff time
+        jitter: Whether to use "full jitter", sleeping a uniformly random time
+            between zero and the capped exponential backoff
+        failure_threshold: Consecutive failures that open the circuit, or
+            None (the default) for no circuit breaker
+        recovery_time: Seconds an open circuit rejects calls
+        total_deadline: Wall-clock budget in seconds for one call including
+            its retries; once the next backoff would exceed it, the last
+            error is raised. None for no budget
         
     Returns:
         Decorated function with retry logic
     """
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            last_exception = None
-            backoff_time = initial_backoff
-            
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                    
-                except NonRetryableError:
-                    # Don't retry non-retryable errors
-                    raise
-                    
-                except Exception as e:
-                    last_exception = e
-                    
-                    if attempt == max_retries - 1:
-                        # Last attempt failed
-                        logger.error(
-                            f"Function {func.__name__} failed after {max_retries} attempts: {e}"
-                        )
-                        raise
-                    
-                    # Calculate backoff time with optional jitter
-                    if jitter:
-                        import random
-                        jitter_factor = random.uniform(0.5, 1.5)
-                        actual_backoff = min(backoff_time * jitter_factor, max_backoff)
-                    else:
-                        actual_backoff = min(backoff_time, max_backoff)
-                    
-                    logger.warning(
-                        f"Function {func.__name__} failed (attempt {attempt + 1}/{max_retries}): {e}. "
-                        f"Retrying in {actual_backoff:.2f}s"
-                    )
-                    
-                    time.sleep(actual_backoff)
-                    backoff_time *= backoff_factor
-            
-            # Should never reach here, but just in case
-            raise last_exception
-        
-        return wrapper
-    return decorator
+    return Retry(RetryPolicy(
+        max_attempts=max_retries,
+        initial_backoff=initial_backoff,
+        max_backoff=max_backoff,
+        backoff_factor=backoff_factor,
+        jitter=jitter,
+        failure_threshold=failure_threshold,
+        recovery_time=recovery_time,
+        total_deadline=total_deadline
+    ))
 
 
 def graceful_degradation(
@@ -132,6 +497,10 @@ def graceful_degradation(
     return decorator
 
 
+# File suffixes of the checkpoint formats supported by StateCheckpoint
+_CHECKPOINT_SUFFIXES = (".json", ".json.gz", ".pkl")
+
+
 class StateCheckpoint:
     """
     Manages state checkpoints for recovery.
@@ -139,17 +508,189 @@ class StateCheckpoint:
     Provides functionality to save and restore workflow state to/from disk.
     """
     
-    def __init__(self, checkpoint_dir: str = ".checkpoints"):
+    def __init__(
+        self,
+        checkpoint_dir: str = ".checkpoints",
+        cache_size: int = 8,
+        background_writes: bool = False
+    ):
         """
         Initialize state checkpoint manager.
         
         Args:
             checkpoint_dir: Directory to store checkpoint files
+            cache_size: Number of checkpoint files whose bytes are kept in memory
+            background_writes: Write checkpoint files on a background thread.
+                States are still serialized on the caller's thread, so later
+                mutations never leak into a pending write; call flush() to
+                wait for outstanding writes and close() once done saving
         """
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(exist_ok=True)
+        self.cache_size = cache_size
+        # path -> ((mtime_ns, size), file bytes), least recently used first;
+        # gzip checkpoints are cached decompressed
+        self._cache: OrderedDict[Path, tuple[tuple[int, int], bytes]] = OrderedDict()
+        self.background_writes = background_writes
+        # Writer thread, started on the first background save
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # Unfinished writes, and failed writes not yet reported to a caller;
+        # finished writes remove themselves from _pending
+        self._pending: dict[Path, Future] = {}
+        self._failed: dict[Path, BaseException] = {}
+        self._pending_lock = threading.Lock()
         logger.info(f"StateCheckpoint initialized with directory: {self.checkpoint_dir}")
     
+    @staticmethod
+    def _atomic_write(checkpoint_path: Path, data: bytes) -> None:
+        """
+        Write data to a checkpoint file so readers never see a partial file.
+        
+        The bytes go to a temporary sibling file which is fsynced and then
+        renamed over the destination, so a crash leaves either the old or the
+        new checkpoint. On POSIX the directory is fsynced as well, making the
+        rename itself durable.
+        
+        Args:
+            checkpoint_path: Final path of the checkpoint file
+            data: Serialized checkpoint contents
+        """
+        # A unique temporary file, so concurrent writers of the same checkpoint
+        # (e.g. two sessions on one topic) never share it
+        fd, tmp_name = tempfile.mkstemp(
+            dir=checkpoint_path.parent, prefix=checkpoint_path.name, suffix=".tmp"
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, checkpoint_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        if os.name == "posix":
+            dir_fd = os.open(checkpoint_path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    
+    def _background_write(self, checkpoint_path: Path, data: bytes) -> None:
+        """Write a checkpoint on the writer thread, keeping any error for the next caller."""
+        try:
+            self._atomic_write(checkpoint_path, data)
+        except BaseException as e:
+            # Recorded before the future completes, so waiters always see it
+            with self._pending_lock:
+                self._failed[checkpoint_path] = e
+            raise
+        else:
+            with self._pending_lock:
+                self._failed.pop(checkpoint_path, None)
+    
+    def _write_done(self, checkpoint_path: Path, future: Future) -> None:
+        """Drop a finished background write from the pending writes."""
+        with self._pending_lock:
+            if self._pending.get(checkpoint_path) is future:
+                del self._pending[checkpoint_path]
+    
+    def _wait_all(self) -> None:
+        """Block until every pending background write has finished."""
+        with self._pending_lock:
+            futures = list(self._pending.values())
+        wait(futures)
+        
+        # Done callbacks run only after waiters wake up, so drop the finished
+        # writes here too
+        with self._pending_lock:
+            for checkpoint_path, future in list(self._pending.items()):
+                if future.done():
+                    del self._pending[checkpoint_path]
+    
+    def _wait_for_write(self, checkpoint_path: Path) -> None:
+        """
+        Block until any pending background write to this path has finished.
+        
+        Raises:
+            Exception: The error of a failed write to this path not yet reported
+        """
+        with self._pending_lock:
+            future = self._pending.get(checkpoint_path)
+        if future is not None:
+            wait([future])
+        with self._pending_lock:
+            if future is not None and self._pending.get(checkpoint_path) is future:
+                del self._pending[checkpoint_path]
+            error = self._failed.pop(checkpoint_path, None)
+        if error is not None:
+            raise error
+    
+    def flush(self) -> None:
+        """
+        Wait for all pending background checkpoint writes to finish.
+        
+        Raises:
+            StateRecoveryError: If any write failed since the last report
+        """
+        self._wait_all()
+        with self._pending_lock:
+            failed, self._failed = self._failed, {}
+        
+        if failed:
+            failures = "; ".join(f"{path}: {error}" for path, error in failed.items())
+            raise StateRecoveryError(f"Checkpoint write failed: {failures}")
+    
+    def close(self) -> None:
+        """
+        Flush pending writes and stop the background writer thread.
+        
+        The manager stays usable; a later background save starts a new writer.
+        
+        Raises:
+            StateRecoveryError: If any write failed since the last report
+        """
+        try:
+            self.flush()
+        finally:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
+    
+    def _read_cached(self, checkpoint_path: Path, read: Callable[[Path], bytes]) -> bytes:
+        """
+        Read a checkpoint file's serialized bytes, reusing them if unchanged.
+        
+        Only bytes are cached, never parsed objects: parsing them again is
+        cheaper than deep-copying a parsed state, and every caller gets its
+        own objects. Entries are validated against the file's mtime and size,
+        so a checkpoint rewritten by another process is never served stale.
+        
+        Args:
+            checkpoint_path: Path to the checkpoint file
+            read: Function returning the (decompressed) bytes of the file
+            
+        Returns:
+            Serialized checkpoint contents
+        """
+        stat = checkpoint_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._cache.get(checkpoint_path)
+        if cached is not None and cached[0] == signature:
+            self._cache.move_to_end(checkpoint_path)
+            logger.debug(f"Checkpoint cache hit: {checkpoint_path}")
+            return cached[1]
+        
+        data = read(checkpoint_path)
+        self._cache[checkpoint_path] = (signature, data)
+        self._cache.move_to_end(checkpoint_path)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return data
+    
     def save_checkpoint(
         self,
         state: Any,
@@ -162,39 +703,76 @@ class StateCheckpoint:
         Args:
             state: State object to save
             checkpoint_id: Unique identifier for this checkpoint
-            format: Format to use ('json' or 'pickle')
+            format: Format to use ('json', 'json.gz' or 'pickle'). 'json.gz'
+                writes compact JSON through fast gzip compression, which is
+                much smaller for large states with extracted source content.
+                'pickle' is a legacy format for states that are not JSON
+                serializable; prefer the JSON formats (see load_checkpoint)
             
         Returns:
-            Path to the saved checkpoint file
+            Path to the saved checkpoint file (still being written when
+            background writes are enabled)
             
         Raises:
             StateRecoveryError: If checkpoint save fails
         """
         try:
-            if format == "json":
-                checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.json"
+            if format in ("json", "json.gz"):
+                checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.{format}"
                 
-                # Convert state to dict if it has model_dump method (Pydantic)
+                # Convert state to dict if it has model_dump method (Pydantic).
+                # JSON mode converts sets, datetimes etc. in pydantic-core, so
+                # they round-trip instead of going through the str() fallback
                 if hasattr(state, 'model_dump'):
-                    state_dict = state.model_dump()
+                    state_dict = state.model_dump(mode="json")
                 elif hasattr(state, 'dict'):
                     state_dict = state.dict()
                 else:
                     state_dict = state
                 
-                with open(checkpoint_path, 'w', encoding='utf-8') as f:
-                    json.dump(state_dict, f, indent=2, default=str)
+                if format == "json":
+                    data = json.dumps(state_dict, indent=2, default=str).encode('utf-8')
+                else:
+                    # Level 1 keeps compression cheap; JSON text compresses well anyway
+                    payload = json.dumps(state_dict, separators=(",", ":"), default=str)
+                    data = gzip.compress(payload.encode('utf-8'), compresslevel=1)
                 
             elif format == "pickle":
                 checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.pkl"
                 
-                with open(checkpoint_path, 'wb') as f:
-                    pickle.dump(state, f)
+                # The highest protocol (5 on Python 3.8+) frames large
+                # payloads more efficiently than the default protocol 4
+                data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
             
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
-            logger.info(f"Checkpoint saved: {checkpoint_path}")
+            self._cache.pop(checkpoint_path, None)
+            
+            if self.background_writes:
+                def write_done(future: Future) -> None:
+                    if future.exception() is not None:
+                        logger.error(
+                            f"Failed to write checkpoint '{checkpoint_id}': {future.exception()}"
+                        )
+                    self._write_done(checkpoint_path, future)
+                
+                if self._io_pool is None:
+                    # A single worker keeps writes to the same path in submission order
+                    self._io_pool = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="checkpoint-writer"
+                    )
+                future = self._io_pool.submit(self._background_write, checkpoint_path, data)
+                # Register before adding the callback, which runs at once if
+                # the write has already finished
+                with self._pending_lock:
+                    self._pending[checkpoint_path] = future
+                future.add_done_callback(write_done)
+                logger.info(f"Checkpoint queued: {checkpoint_path}")
+            else:
+                self._atomic_write(checkpoint_path, data)
+                logger.info(f"Checkpoint saved: {checkpoint_path}")
+            
             return checkpoint_path
             
         except Exception as e:
@@ -212,7 +790,9 @@ class StateCheckpoint:
         
         Args:
             checkpoint_id: Unique identifier for the checkpoint
-            format: Format to use ('json' or 'pickle')
+            format: Format to use ('json', 'json.gz' or 'pickle'). Loading a
+                pickle can execute arbitrary code, so only load pickle
+                checkpoints from a directory nobody else can write to
             state_class: Optional class to reconstruct state object (for JSON)
             
         Returns:
@@ -222,14 +802,21 @@ class StateCheckpoint:
             StateRecoveryError: If checkpoint load fails
         """
         try:
-            if format == "json":
-                checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.json"
+            if format in ("json", "json.gz"):
+                checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.{format}"
+                self._wait_for_write(checkpoint_path)
                 
                 if not checkpoint_path.exists():
                     raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
                 
-                with open(checkpoint_path, 'r', encoding='utf-8') as f:
-                    state_dict = json.load(f)
+                if format == "json":
+                    read = Path.read_bytes
+                else:
+                    def read(path):
+                        return gzip.decompress(path.read_bytes())
+                
+                # Parsed afresh on every load, so callers never share objects
+                state_dict = json.loads(self._read_cached(checkpoint_path, read))
                 
                 # Reconstruct state object if class provided
                 if state_class is not None:
@@ -239,12 +826,12 @@ class StateCheckpoint:
                 
             elif format == "pickle":
                 checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.pkl"
+                self._wait_for_write(checkpoint_path)
                 
                 if not checkpoint_path.exists():
                     raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
                 
-                with open(checkpoint_path, 'rb') as f:
-                    state = pickle.load(f)
+                state = pickle.loads(self._read_cached(checkpoint_path, Path.read_bytes))
             
             else:
                 raise ValueError(f"Unsupported format: {format}")
@@ -261,19 +848,23 @@ class StateCheckpoint:
         List all available checkpoints.
         
         Returns:
-            List of checkpoint IDs
+            Sorted list of checkpoint IDs
         """
-        checkpoints = []
-        
-        for path in self.checkpoint_dir.glob("*.json"):
-            checkpoints.append(path.stem)
+        # Queued checkpoints should be listed; failures were already logged
+        self._wait_all()
+        checkpoints = set()
         
-        for path in self.checkpoint_dir.glob("*.pkl"):
-            if path.stem not in checkpoints:
-                checkpoints.append(path.stem)
+        # One directory scan; an ID saved in several formats is listed once
+        with os.scandir(self.checkpoint_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                for suffix in _CHECKPOINT_SUFFIXES:
+                    if name.endswith(suffix) and entry.is_file():
+                        checkpoints.add(name[:-len(suffix)])
+                        break
         
         logger.debug(f"Found {len(checkpoints)} checkpoints")
-        return checkpoints
+        return sorted(checkpoints)
     
     def delete_checkpoint(self, checkpoint_id: str) -> bool:
         """
@@ -285,16 +876,26 @@ class StateCheckpoint:
         Returns:
             True if checkpoint was deleted, False if not found
         """
+        # Let queued writes land first so they cannot recreate deleted files
+        self._wait_all()
         deleted = False
         
         json_path = self.checkpoint_dir / f"{checkpoint_id}.json"
         if json_path.exists():
             json_path.unlink()
+            self._cache.pop(json_path, None)
+            deleted = True
+        
+        gz_path = self.checkpoint_dir / f"{checkpoint_id}.json.gz"
+        if gz_path.exists():
+            gz_path.unlink()
+            self._cache.pop(gz_path, None)
             deleted = True
         
         pkl_path = self.checkpoint_dir / f"{checkpoint_id}.pkl"
         if pkl_path.exists():
             pkl_path.unlink()
+            self._cache.pop(pkl_path, None)
             deleted = True
         
         if deleted:
@@ -305,6 +906,10 @@ class StateCheckpoint:
         return deleted
 
 
+# Sentinel for attributes that are not present at all
+_MISSING = object()
+
+
 def validate_partial_data(
     data: Any,
     required_fields: list[str],
@@ -324,18 +929,17 @@ def validate_partial_data(
     if not required_fields:
         return True, 1.0
     
-    present_fields = 0
+    if isinstance(data, dict):
+        # Only keys that exist need their values checked
+        values = (data[field] for field in data.keys() & set(required_fields))
+    else:
+        values = (getattr(data, field, _MISSING) for field in required_fields)
     
-    for field in required_fields:
-        if hasattr(data, field):
-            value = getattr(data, field)
-            # Check if field has a meaningful value
-            if value is not None and value != "" and value != []:
-                present_fields += 1
-        elif isinstance(data, dict) and field in data:
-            value = data[field]
-            if value is not None and value != "" and value != []:
-                present_fields += 1
+    # Count fields that have a meaningful value
+    present_fields = sum(
+        1 for value in values
+        if value is not _MISSING and value is not None and value != "" and value != []
+    )
     
     completeness = present_fields / len(required_fields)
     is_valid = completeness >= min_completeness
@@ -348,6 +952,34 @@ def validate_partial_data(
     return is_valid, completeness
 
 
+def _loaded_exception_types(names: tuple[tuple[str, str], ...]) -> tuple[type, ...]:
+    """Resolve (module, attribute) exception names from already-imported modules."""
+    types = []
+    for module_name, attribute in names:
+        module = sys.modules.get(module_name)
+        exc_type = getattr(module, attribute, None) if module is not None else None
+        if isinstance(exc_type, type):
+            types.append(exc_type)
+    return tuple(types)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Check whether an exception signals API rate limiting.
+    
+    Args:
+        error: Exception from API call
+        
+    Returns:
+        True if the error is a provider rate limit error or its message
+        mentions rate limiting
+    """
+    return (
+        isinstance(error, _loaded_exception_types(_RATE_LIMIT_EXC_TYPES))
+        or _RATE_LIMIT_RE.search(str(error)) is not None
+    )
+
+
 def handle_api_error(error: Exception) -> tuple[bool, Optional[float]]:
     """
     Analyze an API error and determine if it's retryable and what backoff to use.
@@ -358,30 +990,33 @@ def handle_api_error(error: Exception) -> tuple[bool, Optional[float]]:
     Returns:
         Tuple of (is_retryable, suggested_backoff_seconds)
     """
-    error_str = str(error).lower()
+    error_str = str(error)
     
     # Rate limit errors - retryable with backoff
-    if "rate limit" in error_str or "429" in error_str:
+    if is_rate_limit_error(error):
         logger.warning("Rate limit error detected")
         return True, 60.0  # Wait 1 minute for rate limits
     
     # Timeout errors - retryable with shorter backoff
-    if "timeout" in error_str or "timed out" in error_str:
+    if (
+        isinstance(error, (TimeoutError, *_loaded_exception_types(_TIMEOUT_EXC_TYPES)))
+        or _TIMEOUT_RE.search(error_str)
+    ):
         logger.warning("Timeout error detected")
         return True, 5.0
     
     # Server errors (5xx) - retryable
-    if "500" in error_str or "502" in error_str or "503" in error_str:
+    if _SERVER_ERROR_RE.search(error_str):
         logger.warning("Server error detected")
         return True, 10.0
     
     # Authentication errors - not retryable
-    if "auth" in error_str or "401" in error_str or "403" in error_str:
+    if _AUTH_ERROR_RE.search(error_str):
         logger.error("Authentication error detected - not retryable")
         return False, None
     
     # Client errors (4xx except 429) - not retryable
-    if "400" in error_str or "404" in error_str:
+    if _CLIENT_ERROR_RE.search(error_str):
         logger.error("Client error detected - not retryable")
         return False, None
     
@@ -6,64 +6,49 @@ based on the configured provider (OpenAI, Anthropic, or Groq).
 """
 
 import logging
-import time
-from typing import Any, Callable
-from functools import wraps
+from functools import cache, lru_cache
+from typing import Any, Optional
 from config import config
+from utils.error_handling import CircuitBreaker, Retry, RetryPolicy
 
 logger = logging.getLogger(__name__)
 
 
-def with_rate_limit_retry(max_retries: int = 3, base_delay: float = 1.0):
+def with_rate_limit_retry(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    breaker: Optional[CircuitBreaker] = None
+) -> Retry:
     """
     Decorator to add exponential backoff retry logic for rate limiting.
     
+    Only rate limit errors are retried; any other error is raised immediately.
+    Delays use "full jitter": a uniformly random time between zero and the
+    capped exponential delay, so concurrent callers don't retry in lockstep.
+    Works for both plain and ``async def`` functions.
+    
+    Pass one ``breaker`` to every call site of a provider to stop calling it
+    while it keeps failing: an open circuit raises CircuitOpenError without
+    making the call.
+    
     Args:
         max_retries: Maximum number of retries
         base_delay: Base delay in seconds (will be exponentially increased)
+        max_delay: Upper bound on the delay before any single retry
+        breaker: Circuit breaker shared with other calls to the same
+            provider, or None for no circuit breaker
     """
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exception = None
-            
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    error_str = str(e).lower()
-                    
-                    # Check if it's a rate limiting error
-                    if any(phrase in error_str for phrase in [
-                        "rate limit", "429", "too many requests", 
-                        "quota exceeded", "rate_limit_exceeded"
-                    ]):
-                        if attempt < max_retries:
-                            delay = base_delay * (2 ** attempt)  # Exponential backoff
-                            logger.warning(
-                                f"⏳ Rate limit hit (attempt {attempt + 1}/{max_retries + 1}). "
-                                f"Retrying in {delay:.1f}s... Error: {e}"
-                            )
-                            time.sleep(delay)
-                            continue
-                        else:
-                            logger.error(f"❌ Rate limit exceeded after {max_retries} retries: {e}")
-                    
-                    # Re-raise non-rate-limit errors immediately
-                    raise e
-            
-            # If we get here, all retries failed
-            raise last_exception
-        
-        return wrapper
-    return decorator
+    return Retry(RetryPolicy.rate_limit_only(max_retries, base_delay, max_delay), breaker)
 
 
 def get_llm(**kwargs: Any) -> Any:
     """
     Get an LLM instance based on the configured provider.
     
+    Instances are cached per provider, API key and arguments, so agents asking
+    for the same model share one client and its warm HTTP connection pool.
+    
     Args:
         **kwargs: Additional arguments to pass to the LLM constructor
         
@@ -79,55 +64,93 @@ def get_llm(**kwargs: Any) -> Any:
         "temperature": config.llm_temperature,
         **kwargs
     }
+    provider = config.llm_provider
+    api_key = getattr(config, f"{provider}_api_key", None)
     
-    if config.llm_provider == "openai":
-        if not config.openai_api_key:
-            raise ValueError("OpenAI API key not configured")
-        
-        from langchain_openai import ChatOpenAI
-        logger.debug(f"Creating ChatOpenAI with model={llm_kwargs['model']}")
-        return ChatOpenAI(
-            api_key=config.openai_api_key,
-            **llm_kwargs
-        )
+    llm_items = tuple(sorted(llm_kwargs.items()))
+    try:
+        hash(llm_items)
+    except TypeError:
+        # Unhashable arguments (e.g. callback lists) can't be cached
+        return _create_llm(provider, api_key, llm_kwargs)
     
-    elif config.llm_provider == "anthropic":
-        if not config.anthropic_api_key:
-            raise ValueError("Anthropic API key not configured")
-        
-        from langchain_anthropic import ChatAnthropic
-        logger.debug(f"Creating ChatAnthropic with model={llm_kwargs['model']}")
-        return ChatAnthropic(
-            api_key=config.anthropic_api_key,
-            **llm_kwargs
+    return _cached_llm(provider, api_key, llm_items)
+
+
+@lru_cache(maxsize=32)
+def _cached_llm(provider: str, api_key: Optional[str], llm_items: tuple) -> Any:
+    """Create an LLM instance once per (provider, API key, arguments) key."""
+    return _create_llm(provider, api_key, dict(llm_items))
+
+
+@cache
+def _load_openai() -> type:
+    """Import and return the OpenAI chat model class."""
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI
+
+
+@cache
+def _load_anthropic() -> type:
+    """Import and return the Anthropic chat model class."""
+    from langchain_anthropic import ChatAnthropic
+    return ChatAnthropic
+
+
+@cache
+def _load_groq() -> type:
+    """Import and return the Groq chat model class."""
+    try:
+        from langchain_groq import ChatGroq
+    except ImportError:
+        raise ImportError(
+            "langchain-groq is not installed. Install it with: pip install langchain-groq"
         )
+    return ChatGroq
+
+
+# provider -> (display name, lazy class loader, constructor overrides)
+_PROVIDERS = {
+    "openai": ("OpenAI", _load_openai, {}),
+    "anthropic": ("Anthropic", _load_anthropic, {}),
+    # Add rate limiting and retry configuration for Groq
+    "groq": ("Groq", _load_groq, {
+        "max_retries": 3,  # Retry on rate limits
+        "request_timeout": 60,  # Longer timeout for retries
+    }),
+}
+
+
+def _create_llm(provider: str, api_key: Optional[str], llm_kwargs: dict) -> Any:
+    """
+    Construct a new LLM instance for the given provider.
     
-    elif config.llm_provider == "groq":
-        if not config.groq_api_key:
-            raise ValueError("Groq API key not configured")
-        
-        try:
-            from langchain_groq import ChatGroq
-        except ImportError:
-            raise ImportError(
-                "langchain-groq is not installed. Install it with: pip install langchain-groq"
-            )
+    Args:
+        provider: LLM provider name
+        api_key: API key for the provider
+        llm_kwargs: Arguments to pass to the LLM constructor
         
-        # Add rate limiting and retry configuration for Groq
-        groq_kwargs = {
-            **llm_kwargs,
-            "max_retries": 3,  # Retry on rate limits
-            "request_timeout": 60,  # Longer timeout for retries
-        }
+    Returns:
+        LLM instance (ChatOpenAI, ChatAnthropic, or ChatGroq)
         
-        logger.debug(f"Creating ChatGroq with model={groq_kwargs['model']}, max_retries=3")
-        return ChatGroq(
-            api_key=config.groq_api_key,
-            **groq_kwargs
-        )
-    
-    else:
+    Raises:
+        ValueError: If provider is not supported or API key is missing
+    """
+    try:
+        display_name, load_llm_class, overrides = _PROVIDERS[provider]
+    except KeyError:
         raise ValueError(
-            f"Unsupported LLM provider: {config.llm_provider}. "
-            f"Supported providers: openai, anthropic, groq"
+            f"Unsupported LLM provider: {provider}. "
+            f"Supported providers: {', '.join(_PROVIDERS)}"
         )
+    
+    if not api_key:
+        raise ValueError(f"{display_name} API key not configured")
+    
+    llm_class = load_llm_class()
+    llm_kwargs = {**llm_kwargs, **overrides}
+    logger.debug(f"Creating {llm_class.__name__} with model={llm_kwargs['model']}")
+    return llm_class(
+        api_key=api_key,
+        **llm_kwargs
+    )
@@ -5,38 +5,129 @@ This module provides structured logging with appropriate levels for different
 types of events: DEBUG, INFO, WARNING, and ERROR.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from contextvars import ContextVar
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 from pathlib import Path
 
+# Structured fields of the active LogContext; each thread and asyncio task
+# sees its own value
+_log_context: ContextVar[dict] = ContextVar("log_context", default={})
+
+# Background listener draining the log queue into the real handlers, and the
+# root logger's handler feeding that queue
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+# Log file rotation and buffering: records are written in batches of up to
+# LOG_BUFFER_CAPACITY, and immediately once an ERROR arrives
+LOG_FILE_MAX_BYTES = 50 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+LOG_BUFFER_CAPACITY = 1024
+
 
 class StructuredFormatter(logging.Formatter):
     """
     Custom formatter that adds structured information to log records.
     """
     
+    # Structured fields prefixed to the message, outermost first
+    _PREFIX_FIELDS = (
+        ('agent', '[{}]'),
+        ('iteration', '[iter={}]'),
+        ('phase', '[{}]'),
+    )
+    
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record with structured information.
         
+        The record itself is left unchanged, so other handlers formatting the
+        same record do not pick up the prefix twice.
+        
         Args:
             record: Log record to format
             
         Returns:
             Formatted log string
         """
-        # Add structured fields if present in extra
-        if hasattr(record, 'phase'):
-            record.msg = f"[{record.phase}] {record.msg}"
+        # Add structured fields if present in extra or the LogContext
+        values = [
+            (template, getattr(record, attr, None))
+            for attr, template in self._PREFIX_FIELDS
+        ]
+        prefix = " ".join(
+            template.format(value) for template, value in values if value is not None
+        )
+        if not prefix:
+            return super().format(record)
         
-        if hasattr(record, 'iteration'):
-            record.msg = f"[iter={record.iteration}] {record.msg}"
+        # The prefix becomes part of the %-format string when args are present
+        if record.args:
+            prefix = prefix.replace('%', '%%')
         
-        if hasattr(record, 'agent'):
-            record.msg = f"[{record.agent}] {record.msg}"
+        msg = record.msg
+        record.msg = f"{prefix} {msg}"
+        try:
+            return super().format(record)
+        finally:
+            record.msg = msg
+
+
+class ContextLogRecord(logging.LogRecord):
+    """
+    Log record that captures the LogContext fields active when it is created.
+    
+    Installed as the log record factory, so every record carries its context
+    however logging is configured (pytest's caplog, library users, API
+    workers). The fields are read through attribute fallback instead of being
+    stored on the record, so ``extra`` may still set the same keys, and wins.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.log_context = _log_context.get()
+    
+    def __getattr__(self, name):
+        # Only called for attributes missing from the record itself
+        try:
+            return self.__dict__["log_context"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+logging.setLogRecordFactory(ContextLogRecord)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Filter that copies a record's LogContext fields onto the record itself.
+    
+    This makes them available to format strings such as ``%(phase)s``.
+    Fields passed explicitly via ``extra`` take precedence over the context.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Add context fields to the record.
         
-        return super().format(record)
+        Args:
+            record: Log record being handled
+            
+        Returns:
+            Always True; records are never dropped
+        """
+        # Records from another factory fall back to the caller's context
+        context = record.__dict__.get("log_context", None)
+        if context is None:
+            context = _log_context.get()
+        for key, value in context.items():
+            record.__dict__.setdefault(key, value)
+        return True
 
 
 def setup_logging(
@@ -47,6 +138,12 @@ def setup_logging(
     """
     Set up structured logging for the application.
     
+    The root logger only enqueues records; a background QueueListener writes
+    them to the console and log file, so logging calls never block on I/O.
+    The log file rotates at LOG_FILE_MAX_BYTES and is written in buffered
+    batches that flush early on ERROR. Call shutdown_logging() to flush and
+    stop the listener (this also runs automatically at interpreter exit).
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional file path for logging output
@@ -66,25 +163,50 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
-    # Remove existing handlers
+    # Remove existing handlers, stopping any previous listener first
+    shutdown_logging()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    # Add console handler
+    # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
-    # Add file handler if specified
+    # File handler if specified
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(numeric_level)
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding='utf-8'
+        )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        buffered_handler = MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_handler.setLevel(numeric_level)
+        handlers.append(buffered_handler)
+    
+    # The root logger only enqueues. The filter copies LogContext fields onto
+    # each record for format strings, falling back to the caller's context
+    # for records from another factory, so it runs here rather than on the
+    # listener thread
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    queue_handler.setLevel(numeric_level)
+    queue_handler.addFilter(ContextFilter())
+    root_logger.addHandler(queue_handler)
+    
+    global _listener, _queue_handler
+    _queue_handler = queue_handler
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
     
     # Set specific log levels for noisy libraries (but allow DEBUG if explicitly set)
     if numeric_level > logging.DEBUG:
@@ -102,6 +224,36 @@ def setup_logging(
     root_logger.info(f"Logging configured: level={log_level}, file={log_file}")
 
 
+def shutdown_logging() -> None:
+    """
+    Flush queued log records and stop the background listener.
+    
+    The queue handler is detached from the root logger first, so later records
+    are not queued with nobody to read them; with no handlers left, Python's
+    last-resort handler prints warnings and errors to stderr. Safe to call
+    more than once; does nothing if logging is not set up.
+    """
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    
+    logging.getLogger().removeHandler(_queue_handler)
+    _queue_handler.close()
+    _queue_handler = None
+    
+    _listener.stop()
+    for handler in _listener.handlers:
+        # Closing a MemoryHandler flushes its buffer but leaves the target open
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+    _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
@@ -119,6 +271,11 @@ class LogContext:
     """
     Context manager for adding structured context to log messages.
     
+    The fields are kept in a context variable and captured by each
+    ContextLogRecord as it is created, so concurrent threads and asyncio
+    tasks each see only their own context. Nested contexts add to (and may
+    override) the fields of the enclosing one.
+    
     Example:
         with LogContext(phase="scout", iteration=1):
             logger.info("Processing sources")
@@ -133,25 +290,18 @@ class LogContext:
             **kwargs: Structured fields to add to log messages
         """
         self.context = kwargs
-        self.old_factory = None
+        self._token = None
     
     def __enter__(self):
-        """Enter the context and modify log record factory."""
-        self.old_factory = logging.getLogRecordFactory()
-        
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            for key, value in self.context.items():
-                setattr(record, key, value)
-            return record
-        
-        logging.setLogRecordFactory(record_factory)
+        """Enter the context and activate its fields."""
+        self._token = _log_context.set({**_log_context.get(), **self.context})
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit the context and restore original log record factory."""
-        if self.old_factory:
-            logging.setLogRecordFactory(self.old_factory)
+        """Exit the context and restore the enclosing fields."""
+        if self._token is not None:
+            _log_context.reset(self._token)
+            self._token = None
 
 
 def log_agent_transition(logger: logging.Logger, from_phase: str, to_phase: str, iteration: int):
@@ -165,7 +315,7 @@ def log_agent_transition(logger: logging.Logger, from_phase: str, to_phase: str,
         iteration: Current iteration number
     """
     logger.debug(
-        f"Agent transition: {from_phase} -> {to_phase}",
+        "Agent transition: %s -> %s", from_phase, to_phase,
         extra={'phase': to_phase, 'iteration': iteration}
     )
 
@@ -180,7 +330,7 @@ def log_entity_extraction(logger: logging.Logger, entity_count: int, phase: str)
         phase: Current phase
     """
     logger.debug(
-        f"Extracted {entity_count} entities",
+        "Extracted %d entities", entity_count,
         extra={'phase': phase, 'entity_count': entity_count}
     )
 
@@ -195,9 +345,13 @@ def log_phase_completion(logger: logging.Logger, phase: str, iteration: int, **m
         iteration: Current iteration number
         **metrics: Additional metrics to log
     """
+    # Only build the metrics summary if the record will actually be emitted
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     metrics_str = ", ".join(f"{k}={v}" for k, v in metrics.items())
     logger.info(
-        f"Phase completed: {metrics_str}",
+        "Phase completed: %s", metrics_str,
         extra={'phase': phase, 'iteration': iteration, **metrics}
     )
 
@@ -213,7 +367,7 @@ def log_source_collection(logger: logging.Logger, source_count: int, unique_doma
         phase: Current phase
     """
     logger.info(
-        f"Collected {source_count} sources from {unique_domains} unique domains",
+        "Collected %d sources from %d unique domains", source_count, unique_domains,
         extra={'phase': phase, 'sources': source_count, 'domains': unique_domains}
     )
 
@@ -230,12 +384,12 @@ def log_data_quality_issue(logger: logging.Logger, issue: str, phase: str, sever
     """
     if severity == "error":
         logger.error(
-            f"Data quality issue: {issue}",
+            "Data quality issue: %s", issue,
             extra={'phase': phase, 'issue_type': 'data_quality'}
         )
     else:
         logger.warning(
-            f"Data quality issue: {issue}",
+            "Data quality issue: %s", issue,
             extra={'phase': phase, 'issue_type': 'data_quality'}
         )
 
@@ -251,7 +405,7 @@ def log_fallback_activation(logger: logging.Logger, primary: str, fallback: str,
         reason: Reason for fallback
     """
     logger.warning(
-        f"Fallback activated: {primary} -> {fallback} (reason: {reason})",
+        "Fallback activated: %s -> %s (reason: %s)", primary, fallback, reason,
         extra={'primary': primary, 'fallback': fallback, 'fallback_reason': reason}
     )
 
@@ -267,7 +421,7 @@ def log_unrecoverable_failure(logger: logging.Logger, operation: str, error: Exc
         phase: Current phase
     """
     logger.error(
-        f"Unrecoverable failure in {operation}: {error}",
+        "Unrecoverable failure in %s: %s", operation, error,
         extra={'phase': phase, 'operation': operation, 'error_type': type(error).__name__},
         exc_info=True
     )